@@ -12,15 +12,21 @@ from pathlib import Path
 src_path = Path(__file__).parent / "src"
 sys.path.insert(0, str(src_path))
 
+from agentl2_llm.api.workers import resolve_worker_count
+
 if __name__ == "__main__":
     # Set environment variables if not set
     if not os.getenv("OPENAI_API_KEY"):
         print("Warning: OPENAI_API_KEY environment variable not set")
 
+    # DEV=1 restores auto-reload; reload only works with a single worker
+    dev_mode = os.getenv("DEV", "0") == "1"
     uvicorn.run(
         "agentl2_llm.api.server:app",
         host="0.0.0.0",
         port=8001,
-        reload=True,
+        reload=dev_mode,
+        workers=resolve_worker_count(dev_mode),
+        access_log=dev_mode,
         log_level="info"
     )
\ No newline at end of file
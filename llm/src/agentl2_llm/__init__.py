@@ -5,19 +5,35 @@ This module provides intelligent legal query processing through an agent-based
 architecture for the agentl2 legal AI assistant.
 """
 
+from importlib import import_module
+from typing import TYPE_CHECKING
+
 __version__ = "0.1.0"
 
 # Agent-based pipeline (new approach)
 # Legacy import removed - using EnhancedAgentPipeline instead
 # from .pipeline.agent_pipeline import AgentPipeline, ConversationManager
-from .agents.facilitator_agent import FacilitatorAgent
-from .agents.search_agent import SearchAgent
-from .agents.response_agent import ResponseAgent
 
-# Legacy components (for compatibility)
-from .pipeline.chatbot import LegalChatbot
-from .search.search_coordinator import SearchCoordinator
-from .response.response_generator import ResponseGenerator
+# Public name -> defining module. Imported on first access, so light modules
+# such as api.workers (used by the uvicorn supervisor) do not load the agents
+# and their OpenAI clients.
+_EXPORTS = {
+    "FacilitatorAgent": ".agents.facilitator_agent",
+    "SearchAgent": ".agents.search_agent",
+    "ResponseAgent": ".agents.response_agent",
+    # Legacy components (for compatibility)
+    "LegalChatbot": ".pipeline.chatbot",
+    "SearchCoordinator": ".search.search_coordinator",
+    "ResponseGenerator": ".response.response_generator",
+}
+
+if TYPE_CHECKING:
+    from .agents.facilitator_agent import FacilitatorAgent
+    from .agents.search_agent import SearchAgent
+    from .agents.response_agent import ResponseAgent
+    from .pipeline.chatbot import LegalChatbot
+    from .search.search_coordinator import SearchCoordinator
+    from .response.response_generator import ResponseGenerator
 
 __all__ = [
     # New agent-based system
@@ -30,4 +46,13 @@ __all__ = [
     "LegalChatbot",
     "SearchCoordinator",
     "ResponseGenerator",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
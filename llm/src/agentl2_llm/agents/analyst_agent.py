@@ -186,10 +186,7 @@ class AnalystAgent(BaseAgent):
 객관적 분석만 하고, 법적 결론은 내리지 말아줘."""
 
         try:
-            messages = [
-                {"role": "system", "content": self.system_prompt},
-                {"role": "user", "content": prompt}
-            ]
+            messages = self._build_messages(prompt)
 
             response = await self._call_llm(messages, max_tokens=1200)
             return response
@@ -4,7 +4,9 @@ Base agent class for the legal chatbot system.
 
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
+from contextlib import nullcontext
 from enum import Enum
 from typing import Dict, List, Optional, Any
 from datetime import datetime
@@ -53,13 +55,18 @@ class BaseAgent(ABC):
         name: str,
         openai_client: openai.AsyncOpenAI,
         model: str = "gpt-4",
-        temperature: float = 0.3
+        temperature: float = 0.3,
+        system_prompt: Optional[str] = None,
+        llm_semaphore: Optional[asyncio.Semaphore] = None
     ):
         self.name = name
         self.client = openai_client
         self.model = model
         self.temperature = temperature
-        self.system_prompt = self._get_system_prompt()
+        # Shared across agents to cap concurrent completions process-wide
+        self.llm_semaphore = llm_semaphore
+        # Fixed per agent so every request shares the same cacheable prefix
+        self.system_prompt = system_prompt or self._get_system_prompt()
 
     @abstractmethod
     def _get_system_prompt(self) -> str:
@@ -82,27 +89,31 @@ class BaseAgent(ABC):
     ) -> str:
         """Call the LLM with messages."""
         try:
-            response = await self.client.chat.completions.create(
-                model=self.model,
-                messages=messages,
-                max_tokens=max_tokens,
-                temperature=self.temperature,
-                presence_penalty=0.1,
-                frequency_penalty=0.1
-            )
+            async with self.llm_semaphore or nullcontext():
+                response = await self.client.chat.completions.create(
+                    model=self.model,
+                    messages=messages,
+                    max_tokens=max_tokens,
+                    temperature=self.temperature,
+                    presence_penalty=0.1,
+                    frequency_penalty=0.1
+                )
             return response.choices[0].message.content.strip()
         except Exception as e:
             logger.error(f"LLM call failed for {self.name}: {e}")
             raise
 
+    def _build_messages(self, prompt: str) -> List[Dict[str, str]]:
+        """Build a single-turn request: static system prompt first, then the dynamic prompt."""
+        return [
+            {"role": "system", "content": self.system_prompt},
+            {"role": "user", "content": prompt}
+        ]
+
     def _build_conversation_history(self, context: ConversationContext) -> List[Dict[str, str]]:
         """Build conversation history for LLM context."""
         messages = [{"role": "system", "content": self.system_prompt}]
 
-        priority_context = self._build_priority_context_message(context)
-        if priority_context:
-            messages.append({"role": "system", "content": priority_context})
-
         # Add conversation history
         for i, (user_msg, agent_resp) in enumerate(
             zip(context.user_messages, context.agent_responses)
@@ -111,6 +122,11 @@ class BaseAgent(ABC):
             if agent_resp.message:
                 messages.append({"role": "assistant", "content": agent_resp.message})
 
+        # The summary changes every turn, so it goes after the history; placed
+        # earlier it would break the cached prompt prefix for the whole history
+        priority_context = self._build_priority_context_message(context)
+        if priority_context:
+            messages.append({"role": "system", "content": priority_context})
 
         return messages
 
@@ -270,10 +270,7 @@ class CitationAgent(BaseAgent):
 추출된 정보를 간결하고 정확하게 정리해줘."""
 
         try:
-            messages = [
-                {"role": "system", "content": self.system_prompt},
-                {"role": "user", "content": prompt}
-            ]
+            messages = self._build_messages(prompt)
 
             response = await self._call_llm(messages, max_tokens=400)
             return response.strip()
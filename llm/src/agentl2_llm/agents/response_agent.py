@@ -19,6 +19,9 @@ class ResponseAgent(BaseAgent):
     Acts as a senior legal advisor providing detailed and accurate advice.
     """
 
+    # Previous user turns quoted in the conversation summary
+    SUMMARY_MAX_TURNS = 5
+
     def __init__(self, **kwargs):
         super().__init__(name="ResponseAgent", **kwargs)
         self.fact_checker = FactChecker()
@@ -164,10 +167,7 @@ class ResponseAgent(BaseAgent):
 답변은 정확하고 실용적이며, 법률 전문가 수준의 품질로 작성해줘."""
 
         try:
-            messages = [
-                {"role": "system", "content": self.system_prompt},
-                {"role": "user", "content": prompt}
-            ]
+            messages = self._build_messages(prompt)
 
             response = await self._call_llm(messages, max_tokens=1500)
             return response
@@ -208,7 +208,10 @@ class ResponseAgent(BaseAgent):
 
         if len(context.user_messages) > 1:
             summary_parts.append("이전 대화:")
-            for i, msg in enumerate(context.user_messages[:-1], 1):
+            # Only the most recent turns, keeping their original numbering
+            previous = context.user_messages[:-1]
+            first = max(len(previous) - self.SUMMARY_MAX_TURNS, 0)
+            for i, msg in enumerate(previous[first:], first + 1):
                 summary_parts.append(f"  {i}. {msg[:100]}...")
 
         return "\n".join(summary_parts)
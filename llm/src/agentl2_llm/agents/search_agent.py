@@ -168,10 +168,7 @@ Facilitator Agent로부터 전달받은 의도(intent)와 키워드(keywords)를
 최적화된 키워드를 콤마로 구분해서 10개 이내로 제공해줘."""
 
         try:
-            messages = [
-                {"role": "system", "content": self.system_prompt},
-                {"role": "user", "content": prompt}
-            ]
+            messages = self._build_messages(prompt)
 
             response = await self._call_llm(messages, max_tokens=300)
 
@@ -264,10 +264,7 @@ class ValidatorAgent(BaseAgent):
 - 강점: [답변의 장점들]"""
 
         try:
-            messages = [
-                {"role": "system", "content": self.system_prompt},
-                {"role": "user", "content": prompt}
-            ]
+            messages = self._build_messages(prompt)
 
             response = await self._call_llm(messages, max_tokens=600)
             return self._parse_validation_response(response, "content")
@@ -319,10 +316,7 @@ class ValidatorAgent(BaseAgent):
 - 검증된 인용 수: X / 전체 Y"""
 
         try:
-            messages = [
-                {"role": "system", "content": self.system_prompt},
-                {"role": "user", "content": prompt}
-            ]
+            messages = self._build_messages(prompt)
 
             response = await self._call_llm(messages, max_tokens=500)
             return self._parse_validation_response(response, "citation")
@@ -368,10 +362,7 @@ class ValidatorAgent(BaseAgent):
 불일치 사항: [구체적 불일치 내용]"""
 
         try:
-            messages = [
-                {"role": "system", "content": self.system_prompt},
-                {"role": "user", "content": prompt}
-            ]
+            messages = self._build_messages(prompt)
 
             response = await self._call_llm(messages, max_tokens=400)
             return self._parse_validation_response(response, "consistency")
@@ -2,6 +2,13 @@
 API module for AgentL2 LLM service.
 """
 
-from .server import app
+__all__ = ["app"]
 
-__all__ = ["app"]
\ No newline at end of file
+
+def __getattr__(name):
+    # The app is imported on first access, so the worker policy in .workers
+    # can be used without building it
+    if name == "app":
+        from .server import app
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -3,36 +3,115 @@ FastAPI server for Enhanced Agent Pipeline.
 """
 
 import asyncio
-import json
+import contextlib
+import copy
 import os
+import tempfile
+import time
 from pathlib import Path
-from typing import Dict, Any, AsyncGenerator, List, Optional
+from typing import Dict, Any, AsyncGenerator, Iterator, List, Optional, Tuple
 
-from fastapi import FastAPI, HTTPException
+from fastapi import Depends, FastAPI, Header, HTTPException, Request
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse
-from pydantic import BaseModel
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+import httpx
+from pydantic import BaseModel, ConfigDict, PrivateAttr, ValidationError, computed_field, model_validator
+import orjson
 import uvicorn
 from loguru import logger
 
+from ..cache import CachedResponse, ResponseCache, SemanticCache
+from ..pipeline.conversation_store import RedisConversationStore
 from ..pipeline.enhanced_agent_pipeline import EnhancedAgentPipeline
 from ..models import LegalResponse
+from .workers import REDIS_URL_ENV, resolve_worker_count
+
+
+class SelectiveGZipMiddleware(GZipMiddleware):
+    """GZip middleware that leaves streaming (SSE) endpoints untouched."""
+
+    def __init__(self, app, excluded_paths=(), **kwargs):
+        super().__init__(app, **kwargs)
+        self.excluded_paths = frozenset(excluded_paths)
+
+    async def __call__(self, scope, receive, send):
+        # GZip buffers the body, which would hold back live SSE events
+        if scope["type"] == "http" and scope["path"] in self.excluded_paths:
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+
+def _extract_last_user(messages: List[Dict[str, str]]) -> str:
+    """Return the content of the most recent user message."""
+    # Walk back from the tail; the latest turn is almost always the user's,
+    # so this usually stops at the first index
+    for index in range(len(messages) - 1, -1, -1):
+        message = messages[index]
+        if message.get("role") == "user":
+            return message.get("content", "")
+    return ""
+
+
+class OrjsonResponse(JSONResponse):
+    """JSON response rendered by orjson, bypassing the stdlib encoder."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_orjson_default)
 
 
 class ChatRequest(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+
     messages: List[Dict[str, str]]
     conversation_id: Optional[str] = None
 
+    _user_message: str = PrivateAttr(default="")
+
+    @model_validator(mode="after")
+    def _require_user_message(self) -> "ChatRequest":
+        # Resolved once at parse time; FastAPI reports the ValueError as a 422
+        self._user_message = _extract_last_user(self.messages)
+        if not self._user_message:
+            raise ValueError("No user message found")
+        return self
 
-class ChatStreamResponse(BaseModel):
-    type: str  # "agent_step", "content", "complete"
-    agent: str = None
-    step: str = None
-    content: str = None
-    final_response: Dict[str, Any] = None
+    @computed_field
+    @property
+    def user_message(self) -> str:
+        """Content of the most recent user turn."""
+        return self._user_message
+
+
+async def parse_chat_request(http_request: Request) -> ChatRequest:
+    """Validate the raw body straight from JSON, skipping the intermediate dict."""
+    try:
+        return ChatRequest.model_validate_json(await http_request.body())
+    except ValidationError as exc:
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in exc.errors(include_url=False)]
+        )
+
+
+# parse_chat_request reads the body itself, so document it for the OpenAPI schema
+_CHAT_REQUEST_OPENAPI = {
+    "requestBody": {
+        "required": True,
+        "content": {"application/json": {"schema": ChatRequest.model_json_schema()}},
+    }
+}
+
+
+# The admin schemas are only needed for docs/validation on rare admin calls,
+# so their validators are built on first use rather than at import time
+_ADMIN_MODEL_CONFIG = ConfigDict(extra="ignore", defer_build=True)
 
 
 class AgentConfig(BaseModel):
+    model_config = _ADMIN_MODEL_CONFIG
+
     name: str
     role: str
     model: str
@@ -45,6 +124,8 @@ class AgentConfig(BaseModel):
 
 
 class AgentConfigurations(BaseModel):
+    model_config = _ADMIN_MODEL_CONFIG
+
     facilitator: AgentConfig
     search: AgentConfig
     analyst: AgentConfig
@@ -54,13 +135,19 @@ class AgentConfigurations(BaseModel):
 
 
 class GlobalSettings(BaseModel):
+    model_config = _ADMIN_MODEL_CONFIG
+
     defaultModel: str
     maxRetries: int
     timeout: int
     enableLogging: bool
 
 
-app = FastAPI(title="AgentL2 LLM Service", version="1.0.0")
+app = FastAPI(
+    title="AgentL2 LLM Service",
+    version="1.0.0",
+    default_response_class=OrjsonResponse
+)
 
 # CORS middleware
 app.add_middleware(
@@ -71,8 +158,36 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Global pipeline instance
+# Compress large JSON payloads (answers, admin configs); never the SSE stream
+app.add_middleware(
+    SelectiveGZipMiddleware,
+    minimum_size=1024,
+    compresslevel=5,
+    excluded_paths=("/chat/stream",),
+)
+
+# Global pipeline instance, created on first use (see get_pipeline)
 pipeline: EnhancedAgentPipeline = None
+# Why the pipeline could not be built; kept so later requests do not retry
+_pipeline_error: Optional[str] = None
+_pipeline_lock = asyncio.Lock()
+
+# /health probes reuse the last pipeline status for this many seconds
+HEALTH_CACHE_TTL = 5.0
+_health_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+
+# Upper bound on the optional startup warmup (AGENTL2_WARMUP=1)
+WARMUP_TIMEOUT = 10.0
+
+# Finished answers for repeated standalone questions (no conversation_id),
+# replayed without running the agents
+response_cache = ResponseCache(maxsize=1024, ttl=900)
+
+# Paraphrase matching for standalone questions (opt-in: AGENTL2_SEMANTIC_CACHE=1)
+semantic_cache: Optional[SemanticCache] = None
+
+# Longer histories change what an answer means, so only short ones are matched
+SEMANTIC_CACHE_MAX_MESSAGES = 1
 
 # Configuration file path
 CONFIG_DIR = Path("./config")
@@ -82,22 +197,45 @@ GLOBAL_CONFIG_FILE = CONFIG_DIR / "global_settings.json"
 # Ensure config directory exists
 CONFIG_DIR.mkdir(exist_ok=True)
 
+# Config files are written human-readable; non-string keys are coerced like json.dump
+_CONFIG_DUMP_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+# Ready-to-send admin GET bodies keyed by config path -> (file mtime, body)
+_config_response_cache: Dict[Path, Tuple[Optional[int], bytes]] = {}
+
+# Pre-encoded SSE framing; only the variable payload is serialized per event
+_SSE_PREFIX = b"data: "
+_SSE_SUFFIX = b"\n\n"
+_CONTENT_PREFIX = b'data: {"type":"content","content":'
+_ENVELOPE_SUFFIX = b"}\n\n"
+_COMPLETE_PREFIX = b'data: {"type":"complete","final_response":'
+
+# Response headers for /chat/stream; X-Accel-Buffering stops proxies buffering events
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "Connection": "keep-alive",
+    "X-Accel-Buffering": "no",
+}
+
+# Sentences are merged into content frames of at least this many characters
+# (~1.5 KiB of UTF-8 for mostly Korean answers) before being flushed
+CONTENT_FRAME_CHARS = 512
+
 
 def serialize_legal_response(response: LegalResponse) -> Dict[str, Any]:
     """Serialize LegalResponse for streaming clients."""
+    sources = response.sources
     return {
         "answer": response.answer,
         "sources": [
             {
-                "source_name": source.title,
-                "description": source.excerpt,
-                "link": source.url,
-                "source_type": source.source_type.value
-                if hasattr(source.source_type, "value")
-                else str(source.source_type),
-                "confidence": source.confidence,
+                "source_name": s.title,
+                "description": s.excerpt,
+                "link": s.url,
+                "source_type": s.source_type.value,
+                "confidence": s.confidence,
             }
-            for source in response.sources
+            for s in sources
         ],
         "followUps": response.follow_up_questions,
         "confidence": response.confidence,
@@ -106,41 +244,239 @@ def serialize_legal_response(response: LegalResponse) -> Dict[str, Any]:
     }
 
 
-def chunk_response_text(text_value: str) -> List[str]:
+def serialize_chat_response(response: LegalResponse) -> Dict[str, Any]:
+    """Serialize LegalResponse for the non-streaming /chat endpoint."""
+    sources = response.sources
+    return {
+        "answer": response.answer,
+        "sources": [
+            {
+                "source_name": s.title,
+                "description": s.excerpt,
+                "link": s.url
+            } for s in sources
+        ],
+        "followUps": response.follow_up_questions,
+        "confidence": response.confidence,
+        "processing_time": response.processing_time
+    }
+
+
+def chunk_response_text(text_value: str) -> Iterator[str]:
     """Split long answer text into smaller streaming chunks."""
-    if not text_value:
-        return []
+    # One sentence per chunk; the ". " separator stays attached so chunks concatenate back
+    position, length = 0, len(text_value)
+    while position < length:
+        separator = text_value.find(". ", position)
+        end = length if separator < 0 else separator + 2
+        chunk = text_value[position:end]
+        position = end
+        if chunk.strip():
+            yield chunk
+
+
+def _orjson_default(value: Any) -> Any:
+    """Fallback for types orjson does not serialize natively."""
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    if isinstance(value, Path):
+        return str(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def _encode_event(event: Dict[str, Any]) -> bytes:
+    """Encode a generic event (agent_step/complete/error) as an SSE frame."""
+    return _SSE_PREFIX + orjson.dumps(event, default=_orjson_default) + _SSE_SUFFIX
+
+
+def _encode_content_event(chunk: str) -> bytes:
+    """Encode a content chunk as an SSE frame using the pre-built envelope."""
+    return _CONTENT_PREFIX + orjson.dumps(chunk) + _ENVELOPE_SUFFIX
+
+
+def _encode_complete_event(payload: Dict[str, Any]) -> bytes:
+    """Encode the final response as an SSE frame, splicing it into a fixed envelope."""
+    return _COMPLETE_PREFIX + orjson.dumps(payload, default=_orjson_default) + _ENVELOPE_SUFFIX
+
+
+def encode_content_events(text_value: str) -> Iterator[bytes]:
+    """Split answer text into ready-to-send SSE content frames, merging short sentences."""
+    pending: List[str] = []
+    pending_size = 0
+
+    for chunk in chunk_response_text(text_value):
+        pending.append(chunk)
+        pending_size += len(chunk)
+        if pending_size >= CONTENT_FRAME_CHARS:
+            yield _encode_content_event("".join(pending))
+            pending.clear()
+            pending_size = 0
+
+    if pending:
+        yield _encode_content_event("".join(pending))
+
+
+def _build_cached_response(response: LegalResponse) -> CachedResponse:
+    """Serialize a finished response once for streaming and caching."""
+    payload = serialize_legal_response(response)
+    return CachedResponse(
+        response=response,
+        payload=payload,
+        content_frames=list(encode_content_events(response.answer)),
+        complete_frame=_encode_complete_event(payload),
+        chat_payload=serialize_chat_response(response),
+    )
+
+
+async def _lookup_response(
+    cache_key: bytes,
+    user_message: str,
+    semantic: bool = False
+) -> Tuple[Optional[CachedResponse], Optional[List[float]]]:
+    """Check the exact cache, then the semantic cache; returns (entry, query vector)."""
+    cached = response_cache.get(cache_key)
+    if cached is not None or not semantic or semantic_cache is None:
+        return cached, None
 
-    parts = text_value.split('. ')
-    chunks: List[str] = []
-    for index, part in enumerate(parts):
-        clean = part.strip()
-        if not clean:
-            continue
-        suffix = '. ' if index < len(parts) - 1 else ''
-        chunks.append(clean + suffix)
-    return chunks
+    try:
+        return await semantic_cache.lookup(user_message)
+    except Exception as e:
+        logger.warning(f"Semantic cache lookup failed: {e}")
+        return None, None
+
+
+def _remember_response(
+    cache_key: Optional[bytes],
+    entry: CachedResponse,
+    vector: Optional[List[float]] = None
+) -> None:
+    """Cache a finished response unless it is an error/limit fallback."""
+    if cache_key is not None and entry.response.confidence > 0.0:
+        response_cache.set(cache_key, entry)
+        if vector is not None and semantic_cache is not None:
+            semantic_cache.add(vector, entry)
+
+
+def _response_cache_key(conversation_id: Optional[str], user_message: str) -> Optional[bytes]:
+    """Cache key for a standalone question, or None for a conversation turn.
+
+    A conversation turn depends on the history so far and must go through the
+    pipeline to be recorded and counted toward the turn limit.
+    """
+    if conversation_id is not None:
+        return None
+    return ResponseCache.make_key(None, user_message)
+
+
+def _allows_semantic_cache(request: ChatRequest) -> bool:
+    """Only standalone questions may be answered from a paraphrase match."""
+    return request.conversation_id is None and len(request.messages) <= SEMANTIC_CACHE_MAX_MESSAGES
+
+
+def _is_cache_bypassed(header_value: Optional[str]) -> bool:
+    """Interpret the X-Cache-Bypass header used for admin testing."""
+    return bool(header_value) and header_value.lower() not in ("0", "false", "no")
+
+
+def _create_conversation_store() -> Optional[RedisConversationStore]:
+    """Connect the shared conversation store when AGENTL2_REDIS_URL is set."""
+    redis_url = os.getenv(REDIS_URL_ENV)
+    if not redis_url:
+        return None
+
+    # redis is only required for multi-worker deployments
+    try:
+        import redis.asyncio as redis_asyncio
+    except ImportError as e:
+        raise RuntimeError(
+            f"{REDIS_URL_ENV} is set but redis is not installed; "
+            "install agentl2-llm with the 'redis' extra (poetry install -E redis)"
+        ) from e
+
+    app.state.redis_client = redis_asyncio.from_url(redis_url)
+    logger.info("Conversations shared through Redis")
+    return RedisConversationStore(app.state.redis_client)
+
+
+async def _close_clients() -> None:
+    """Close the shared HTTP and Redis clients, if they were created."""
+    for name in ("http_client", "redis_client"):
+        client = getattr(app.state, name, None)
+        if client is not None:
+            await client.aclose()
+            delattr(app.state, name)
+
+
+async def _create_pipeline() -> EnhancedAgentPipeline:
+    """Build the agent pipeline and its shared HTTP client; raises if it cannot."""
+    global semantic_cache
+    openai_api_key = os.getenv("OPENAI_API_KEY")
+    if not openai_api_key:
+        raise RuntimeError("OPENAI_API_KEY not set")
+
+    try:
+        # One pooled HTTP/2 client shared by every agent call to the OpenAI API
+        app.state.http_client = httpx.AsyncClient(
+            http2=True,
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            limits=httpx.Limits(max_connections=200, max_keepalive_connections=100),
+        )
+        new_pipeline = EnhancedAgentPipeline(
+            openai_api_key=openai_api_key,
+            openai_model="gpt-4",
+            temperature=0.3,
+            http_client=app.state.http_client,
+            conversation_store=_create_conversation_store()
+        )
+    except Exception:
+        # Nothing else owns the clients yet
+        await _close_clients()
+        raise
+    logger.info("Enhanced Agent Pipeline initialized")
+
+    if os.getenv("AGENTL2_SEMANTIC_CACHE") == "1":
+        semantic_cache = SemanticCache(new_pipeline.embed)
+        logger.info("Semantic response cache enabled")
+
+    return new_pipeline
+
+
+async def get_pipeline() -> Optional[EnhancedAgentPipeline]:
+    """Return the agent pipeline, creating it on first use.
+
+    A failed build is remembered: later calls return None right away instead
+    of retrying and logging the same error on every request.
+    """
+    global pipeline, _pipeline_error
+    if pipeline is None and _pipeline_error is None:
+        async with _pipeline_lock:
+            if pipeline is None and _pipeline_error is None:
+                try:
+                    pipeline = await _create_pipeline()
+                except Exception as e:
+                    _pipeline_error = str(e)
+                    logger.error(f"Agent pipeline unavailable: {e}")
+    return pipeline
 
 
 @app.on_event("startup")
 async def startup_event():
-    """Initialize the agent pipeline on startup."""
-    global pipeline
-    openai_api_key = os.getenv("OPENAI_API_KEY")
-    if openai_api_key:
+    """Warm the agent pipeline up front when AGENTL2_WARMUP=1.
+
+    Otherwise the pipeline is built lazily on the first request, so the
+    server starts accepting connections immediately.
+    """
+    if os.getenv("AGENTL2_WARMUP") != "1":
+        return
+
+    active = await get_pipeline()
+    if active:
         try:
-            pipeline = EnhancedAgentPipeline(
-                openai_api_key=openai_api_key,
-                openai_model="gpt-4",
-                temperature=0.3
-            )
-            logger.info("Enhanced Agent Pipeline initialized")
+            await asyncio.wait_for(active.warmup(), timeout=WARMUP_TIMEOUT)
         except Exception as e:
-            logger.warning(f"Failed to initialize pipeline: {e}")
-            pipeline = None
-    else:
-        logger.warning("OPENAI_API_KEY not set - pipeline will be unavailable")
-        pipeline = None
+            logger.warning(f"Pipeline warmup skipped: {e!r}")
 
 
 @app.on_event("shutdown")
@@ -151,127 +487,119 @@ async def shutdown_event():
         await pipeline.close()
         logger.info("Enhanced Agent Pipeline closed")
 
+    await _close_clients()
+
 
 async def process_with_streaming(
     user_message: str,
-    conversation_id: Optional[str] = None
-) -> AsyncGenerator[str, None]:
-    """Process message through agent pipeline with streaming updates."""
+    conversation_id: Optional[str] = None,
+    use_cache: bool = True,
+    http_request: Optional[Request] = None,
+    semantic: bool = False
+) -> AsyncGenerator[bytes, None]:
+    """
+    Process message through agent pipeline with streaming updates.
+
+    When ``http_request`` is given, the pipeline is stopped as soon as the
+    client disconnects instead of running the remaining agents for nobody.
+    """
 
     if not pipeline:
         raise RuntimeError("Agent pipeline not initialized")
 
-    event_queue: asyncio.Queue[Dict[str, Any]] = asyncio.Queue()
-
-    async def event_handler(agent: str, payload: Dict[str, Any]) -> None:
-        await event_queue.put(
-            {
-                "type": "agent_step",
-                "agent": agent,
-                "payload": payload,
-            }
-        )
+    cache_key = _response_cache_key(conversation_id, user_message)
+    vector: Optional[List[float]] = None
+    if use_cache and cache_key is not None:
+        cached, vector = await _lookup_response(cache_key, user_message, semantic)
+        if cached is not None:
+            for frame in cached.content_frames:
+                yield frame
+            yield cached.complete_frame
+            return
 
-    async def runner() -> None:
-        try:
-            response: LegalResponse = await pipeline.process_message(
-                user_message,
-                conversation_id,
-                event_handler=event_handler,
-            )
+    events = pipeline.process_message_stream(user_message, conversation_id)
 
-            for chunk in chunk_response_text(response.answer):
-                await event_queue.put(
-                    {
-                        "type": "content",
-                        "content": chunk,
-                    }
-                )
+    try:
+        async for event in events:
+            if http_request is not None and await http_request.is_disconnected():
+                logger.info("Client disconnected; stopping agent pipeline")
+                break
 
-            await event_queue.put(
+            yield _encode_event(
                 {
-                    "type": "complete",
-                    "final_response": serialize_legal_response(response),
+                    "type": "agent_step",
+                    "agent": event.agent,
+                    "payload": event.payload,
                 }
             )
-        except Exception as exc:
-            logger.error(f"Error in streaming process: {exc}")
-            await event_queue.put({"type": "error", "error": str(exc)})
-        finally:
-            await event_queue.put({"type": "_sentinel"})
 
-    worker = asyncio.create_task(runner())
+            if event.response is None:
+                continue
 
-    try:
-        while True:
-            event = await event_queue.get()
-            if event.get("type") == "_sentinel":
-                break
-            yield f"data: {json.dumps(event, ensure_ascii=False)}\n\n"
-    finally:
-        await worker
+            entry = _build_cached_response(event.response)
+            for frame in entry.content_frames:
+                yield frame
 
-@app.post("/chat/stream")
-async def chat_stream(request: ChatRequest):
-    """Stream chat response through enhanced agent pipeline."""
+            yield entry.complete_frame
+            _remember_response(cache_key, entry, vector)
+    except Exception as exc:
+        logger.error(f"Error in streaming process: {exc}")
+        yield _encode_event({"type": "error", "error": str(exc)})
+    finally:
+        # Cancels any in-flight agent calls when the stream ends early
+        await events.aclose()
 
-    if not pipeline:
-        raise HTTPException(status_code=500, detail="Agent pipeline not initialized")
 
-    # Extract user message from messages
-    user_message = ""
-    for message in reversed(request.messages):
-        if message.get("role") == "user":
-            user_message = message.get("content", "")
-            break
+@app.post("/chat/stream", openapi_extra=_CHAT_REQUEST_OPENAPI)
+async def chat_stream(
+    http_request: Request,
+    request: ChatRequest = Depends(parse_chat_request),
+    x_cache_bypass: Optional[str] = Header(default=None)
+):
+    """Stream chat response through enhanced agent pipeline."""
 
-    if not user_message:
-        raise HTTPException(status_code=400, detail="No user message found")
+    if not await get_pipeline():
+        raise HTTPException(status_code=503, detail="Agent pipeline not initialized")
 
     return StreamingResponse(
-        process_with_streaming(user_message, request.conversation_id),
-        media_type="text/plain",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "Content-Type": "text/event-stream"
-        }
+        process_with_streaming(
+            request.user_message,
+            request.conversation_id,
+            use_cache=not _is_cache_bypassed(x_cache_bypass),
+            http_request=http_request,
+            semantic=_allows_semantic_cache(request),
+        ),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS
     )
 
 
-@app.post("/chat")
-async def chat(request: ChatRequest):
+@app.post("/chat", openapi_extra=_CHAT_REQUEST_OPENAPI)
+async def chat(
+    request: ChatRequest = Depends(parse_chat_request),
+    x_cache_bypass: Optional[str] = Header(default=None)
+):
     """Process chat message through enhanced agent pipeline."""
 
-    if not pipeline:
-        raise HTTPException(status_code=500, detail="Agent pipeline not initialized")
-
-    # Extract user message from messages
-    user_message = ""
-    for message in reversed(request.messages):
-        if message.get("role") == "user":
-            user_message = message.get("content", "")
-            break
-
-    if not user_message:
-        raise HTTPException(status_code=400, detail="No user message found")
+    active = await get_pipeline()
+    if not active:
+        raise HTTPException(status_code=503, detail="Agent pipeline not initialized")
 
     try:
-        response: LegalResponse = await pipeline.process_message(user_message, request.conversation_id)
+        cache_key = _response_cache_key(request.conversation_id, request.user_message)
+        cached, vector = None, None
+        if cache_key is not None and not _is_cache_bypassed(x_cache_bypass):
+            cached, vector = await _lookup_response(
+                cache_key, request.user_message, _allows_semantic_cache(request)
+            )
 
-        return {
-            "answer": response.answer,
-            "sources": [
-                {
-                    "source_name": source.title,
-                    "description": source.excerpt,
-                    "link": source.url
-                } for source in response.sources
-            ],
-            "followUps": response.follow_up_questions,
-            "confidence": response.confidence,
-            "processing_time": response.processing_time
-        }
+        if cached is None:
+            response = await active.process_message(request.user_message, request.conversation_id)
+            cached = _build_cached_response(response)
+            _remember_response(cache_key, cached, vector)
+
+        # Returning the response directly skips FastAPI's jsonable_encoder pass
+        return OrjsonResponse(cached.chat_payload)
 
     except Exception as e:
         logger.error(f"Error processing chat: {e}")
@@ -281,24 +609,32 @@ async def chat(request: ChatRequest):
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
-    status = "healthy" if pipeline else "unhealthy"
+    global _health_cache
+    now = time.monotonic()
+    if _health_cache is not None and now - _health_cache[0] < HEALTH_CACHE_TTL:
+        return OrjsonResponse(_health_cache[1])
+
+    active = await get_pipeline()
+    status = "healthy" if active else "unhealthy"
 
     pipeline_status = None
-    if pipeline:
+    if active:
         try:
-            pipeline_status = await pipeline.get_pipeline_status()
+            pipeline_status = await active.get_pipeline_status()
         except Exception as e:
             logger.error(f"Error getting pipeline status: {e}")
             status = "degraded"
 
-    return {
+    payload = {
         "status": status,
         "pipeline": pipeline_status
     }
+    _health_cache = (now, payload)
+    return OrjsonResponse(payload)
 
 
-def load_default_agent_configs() -> Dict[str, Any]:
-    """Load default agent configurations."""
+def _build_default_agent_configs() -> Dict[str, Any]:
+    """Build the default agent configurations."""
     return {
         "facilitator": {
             "name": "전달자(Facilitator)",
@@ -429,8 +765,8 @@ Facilitator Agent로부터 전달받은 의도(intent)와 키워드(keywords)를
     }
 
 
-def load_default_global_settings() -> Dict[str, Any]:
-    """Load default global settings."""
+def _build_default_global_settings() -> Dict[str, Any]:
+    """Build the default global settings."""
     return {
         "defaultModel": "gpt-4",
         "maxRetries": 3,
@@ -439,28 +775,77 @@ def load_default_global_settings() -> Dict[str, Any]:
     }
 
 
+# Built once; treat as read-only and hand out copies via the loaders below
+_DEFAULT_AGENT_CONFIGS = _build_default_agent_configs()
+_DEFAULT_GLOBAL_SETTINGS = _build_default_global_settings()
+
+
+def load_default_agent_configs() -> Dict[str, Any]:
+    """Load default agent configurations (a private, mutable copy)."""
+    return copy.deepcopy(_DEFAULT_AGENT_CONFIGS)
+
+
+def load_default_global_settings() -> Dict[str, Any]:
+    """Load default global settings (a private, mutable copy)."""
+    return copy.deepcopy(_DEFAULT_GLOBAL_SETTINGS)
+
+
+def _write_bytes_atomic(path: Path, payload: bytes) -> None:
+    """Write to a sibling temp file and swap it in, so readers never see a partial file."""
+    fd, temp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        os.fchmod(fd, 0o644)  # mkstemp creates 0600; keep configs world-readable as before
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+        os.replace(temp_name, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(temp_name)
+        raise
+
+
+async def _write_json_file(path: Path, data: Any) -> None:
+    """Write a JSON config file (UTF-8, 2-space indent) atomically, off the event loop."""
+    payload = orjson.dumps(data, default=_orjson_default, option=_CONFIG_DUMP_OPTIONS)
+    await asyncio.to_thread(_write_bytes_atomic, path, payload)
+    _config_response_cache.pop(path, None)
+
+
+async def _config_response(path: Path, defaults: Dict[str, Any]) -> Response:
+    """Serve a config file as a success envelope, re-reading it only when it changes."""
+    try:
+        mtime: Optional[int] = path.stat().st_mtime_ns
+    except FileNotFoundError:
+        mtime = None
+
+    cached = _config_response_cache.get(path)
+    if cached is None or cached[0] != mtime:
+        if mtime is None:
+            raw = orjson.dumps(defaults, default=_orjson_default)
+        else:
+            raw = await asyncio.to_thread(path.read_bytes)
+            orjson.loads(raw)  # reject a corrupt file before caching it
+        cached = (mtime, b'{"success":true,"data":' + raw + b"}")
+        _config_response_cache[path] = cached
+
+    return Response(content=cached[1], media_type="application/json")
+
+
 @app.get("/admin/agent-configs")
 async def get_agent_configs():
     """Get current agent configurations."""
     try:
-        if AGENT_CONFIG_FILE.exists():
-            with open(AGENT_CONFIG_FILE, 'r', encoding='utf-8') as f:
-                configs = json.load(f)
-        else:
-            configs = load_default_agent_configs()
-
-        return {"success": True, "data": configs}
+        return await _config_response(AGENT_CONFIG_FILE, _DEFAULT_AGENT_CONFIGS)
     except Exception as e:
         logger.error(f"Error loading agent configs: {e}")
-        return {"success": False, "error": str(e), "data": load_default_agent_configs()}
+        return {"success": False, "error": str(e), "data": _DEFAULT_AGENT_CONFIGS}
 
 
 @app.post("/admin/agent-configs")
 async def save_agent_configs(configs: Dict[str, Any]):
     """Save agent configurations."""
     try:
-        with open(AGENT_CONFIG_FILE, 'w', encoding='utf-8') as f:
-            json.dump(configs, f, indent=2, ensure_ascii=False)
+        await _write_json_file(AGENT_CONFIG_FILE, configs)
 
         logger.info("Agent configurations saved successfully")
         return {"success": True, "message": "설정이 성공적으로 저장되었습니다."}
@@ -473,24 +858,17 @@ async def save_agent_configs(configs: Dict[str, Any]):
 async def get_global_settings():
     """Get current global settings."""
     try:
-        if GLOBAL_CONFIG_FILE.exists():
-            with open(GLOBAL_CONFIG_FILE, 'r', encoding='utf-8') as f:
-                settings = json.load(f)
-        else:
-            settings = load_default_global_settings()
-
-        return {"success": True, "data": settings}
+        return await _config_response(GLOBAL_CONFIG_FILE, _DEFAULT_GLOBAL_SETTINGS)
     except Exception as e:
         logger.error(f"Error loading global settings: {e}")
-        return {"success": False, "error": str(e), "data": load_default_global_settings()}
+        return {"success": False, "error": str(e), "data": _DEFAULT_GLOBAL_SETTINGS}
 
 
 @app.post("/admin/global-settings")
 async def save_global_settings(settings: Dict[str, Any]):
     """Save global settings."""
     try:
-        with open(GLOBAL_CONFIG_FILE, 'w', encoding='utf-8') as f:
-            json.dump(settings, f, indent=2, ensure_ascii=False)
+        await _write_json_file(GLOBAL_CONFIG_FILE, settings)
 
         logger.info("Global settings saved successfully")
         return {"success": True, "message": "글로벌 설정이 성공적으로 저장되었습니다."}
@@ -504,14 +882,12 @@ async def reset_to_defaults():
     """Reset all configurations to default values."""
     try:
         # Save default configs
-        default_agent_configs = load_default_agent_configs()
-        default_global_settings = load_default_global_settings()
+        default_agent_configs = _DEFAULT_AGENT_CONFIGS
+        default_global_settings = _DEFAULT_GLOBAL_SETTINGS
 
-        with open(AGENT_CONFIG_FILE, 'w', encoding='utf-8') as f:
-            json.dump(default_agent_configs, f, indent=2, ensure_ascii=False)
+        await _write_json_file(AGENT_CONFIG_FILE, default_agent_configs)
 
-        with open(GLOBAL_CONFIG_FILE, 'w', encoding='utf-8') as f:
-            json.dump(default_global_settings, f, indent=2, ensure_ascii=False)
+        await _write_json_file(GLOBAL_CONFIG_FILE, default_global_settings)
 
         logger.info("Configurations reset to defaults")
         return {
@@ -528,10 +904,14 @@ async def reset_to_defaults():
 
 
 if __name__ == "__main__":
+    # DEV=1 restores auto-reload; reload only works with a single worker
+    dev_mode = os.getenv("DEV", "0") == "1"
     uvicorn.run(
         "server:app",
         host="0.0.0.0",
         port=8001,
-        reload=True,
+        reload=dev_mode,
+        workers=resolve_worker_count(dev_mode),
+        access_log=dev_mode,
         log_level="info"
     )
@@ -0,0 +1,32 @@
+"""
+Worker-count policy for the uvicorn runners.
+
+Kept free of application imports so the uvicorn supervisor process can use
+it without loading the FastAPI app, the agents or their clients.
+"""
+
+import os
+
+from loguru import logger
+
+
+# Conversations are shared across workers only through Redis; without it each
+# worker keeps its own contexts, so the server runs a single worker
+REDIS_URL_ENV = "AGENTL2_REDIS_URL"
+
+
+def resolve_worker_count(dev_mode: bool = False) -> int:
+    """Number of uvicorn workers to run.
+
+    WORKERS above 1 is only honoured when AGENTL2_REDIS_URL is set. Otherwise
+    a follow-up turn could reach a worker without the conversation's history,
+    turn count or priority memory. The response caches stay per worker either
+    way, since they only save work.
+    """
+    if dev_mode:
+        return 1
+    workers = int(os.getenv("WORKERS", "1"))
+    if workers > 1 and not os.getenv(REDIS_URL_ENV):
+        logger.warning(f"WORKERS={workers} needs {REDIS_URL_ENV} to share conversations; running 1 worker")
+        return 1
+    return workers
@@ -0,0 +1,7 @@
+"""Response caching components."""
+
+from .embedding_batcher import EmbeddingBatcher
+from .response_cache import CachedResponse, ResponseCache
+from .semantic import SemanticCache
+
+__all__ = ["CachedResponse", "EmbeddingBatcher", "ResponseCache", "SemanticCache"]
@@ -0,0 +1,86 @@
+"""
+Micro-batching of concurrent embedding requests.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Awaitable, Callable, List, Optional, Sequence, Tuple
+
+from loguru import logger
+
+
+EmbedBatchFunction = Callable[[List[str]], Awaitable[Sequence[Sequence[float]]]]
+
+
+class EmbeddingBatcher:
+    """
+    Coalesces embedding requests that arrive within a short window.
+
+    Concurrent requests (e.g. semantic cache lookups for simultaneous chats)
+    are sent as one embeddings call with a list input, instead of one HTTP
+    round trip per question. A batch is flushed when it reaches max_batch or
+    flush_interval seconds after its first request.
+    """
+
+    def __init__(
+        self,
+        embed_batch: EmbedBatchFunction,
+        flush_interval: float = 0.008,
+        max_batch: int = 32
+    ):
+        self.embed_batch = embed_batch
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+        self._pending: List[Tuple[str, asyncio.Future]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._flush_tasks: set[asyncio.Task] = set()
+
+    async def submit(self, text: str) -> List[float]:
+        """Queue text for the next batch and wait for its embedding."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((text, future))
+
+        if len(self._pending) >= self.max_batch:
+            self._start_flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.flush_interval, self._start_flush)
+
+        return await future
+
+    def _start_flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+
+        # Keep a reference so the task is not garbage collected mid-flight
+        task = asyncio.get_running_loop().create_task(self._flush(batch))
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    async def _flush(self, batch: List[Tuple[str, asyncio.Future]]) -> None:
+        try:
+            vectors = await self.embed_batch([text for text, _ in batch])
+            # A short result would leave the unmatched callers waiting forever
+            if len(vectors) != len(batch):
+                raise ValueError(f"Expected {len(batch)} embeddings, got {len(vectors)}")
+        except asyncio.CancelledError:
+            for _, future in batch:
+                future.cancel()
+            raise
+        except Exception as exc:
+            logger.warning(f"Embedding batch of {len(batch)} failed: {exc}")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        for (_, future), vector in zip(batch, vectors):
+            # A caller that was cancelled meanwhile no longer wants its result
+            if not future.done():
+                future.set_result(list(vector))
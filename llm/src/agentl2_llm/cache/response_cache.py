@@ -0,0 +1,72 @@
+"""
+Bounded LRU + TTL cache for finished pipeline responses.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..models import LegalResponse
+
+
+@dataclass
+class CachedResponse:
+    """A finished answer plus its pre-encoded streaming frames."""
+    response: LegalResponse
+    payload: Dict[str, Any]                                  # serialized final response
+    content_frames: List[bytes] = field(default_factory=list)  # ready-to-send SSE frames
+    complete_frame: bytes = b""                               # ready-to-send "complete" frame
+    chat_payload: Dict[str, Any] = field(default_factory=dict)  # body for the /chat endpoint
+
+
+class ResponseCache:
+    """
+    Least-recently-used response cache with per-entry expiry.
+
+    Keys are derived from the conversation id and the normalized user
+    message, so repeated questions skip the whole agent pipeline.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 900.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[bytes, Tuple[float, CachedResponse]]" = OrderedDict()
+
+    @staticmethod
+    def make_key(conversation_id: Optional[str], user_message: str) -> bytes:
+        """Build a compact cache key for a conversation turn."""
+        normalized = (conversation_id or "") + "\0" + user_message.strip().lower()
+        return hashlib.blake2b(normalized.encode("utf-8"), digest_size=16).digest()
+
+    def get(self, key: bytes) -> Optional[CachedResponse]:
+        """Return a live entry and mark it as recently used."""
+        item = self._entries.get(key)
+        if item is None:
+            return None
+
+        expires_at, value = item
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: bytes, value: CachedResponse) -> None:
+        """Store an entry, evicting the least recently used one when full."""
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
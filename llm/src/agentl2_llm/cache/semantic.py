@@ -0,0 +1,93 @@
+"""
+Similarity-based response cache for paraphrased questions.
+"""
+
+from __future__ import annotations
+
+import math
+import operator
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, List, Optional, Sequence, Tuple
+
+from .response_cache import CachedResponse
+
+
+EmbedFunction = Callable[[str], Awaitable[Sequence[float]]]
+
+
+class SemanticCache:
+    """
+    Bounded cache that matches questions by embedding cosine similarity.
+
+    Vectors are normalized on insert, so a lookup is one dot product per
+    entry. Intended for a few hundred entries; beyond that an ANN index
+    would be the better tool.
+    """
+
+    def __init__(
+        self,
+        embed: EmbedFunction,
+        threshold: float = 0.92,
+        maxsize: int = 512,
+        ttl: float = 900.0
+    ):
+        self.embed = embed
+        self.threshold = threshold
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[int, Tuple[float, List[float], CachedResponse]]" = OrderedDict()
+        self._next_id = 0
+
+    async def lookup(self, text: str) -> Tuple[Optional[CachedResponse], List[float]]:
+        """
+        Return the closest live entry above the threshold and the query vector.
+
+        The vector is returned on a miss too, so the caller can store the
+        freshly generated answer without embedding the question twice.
+        """
+        vector = self._normalize(await self.embed(text))
+        now = time.monotonic()
+
+        best_id: Optional[int] = None
+        best_score = self.threshold
+        expired: List[int] = []
+
+        for entry_id, (expires_at, entry_vector, _) in self._entries.items():
+            if expires_at <= now:
+                expired.append(entry_id)
+                continue
+            score = sum(map(operator.mul, vector, entry_vector))
+            if score >= best_score:
+                best_id, best_score = entry_id, score
+
+        for entry_id in expired:
+            del self._entries[entry_id]
+
+        if best_id is None:
+            return None, vector
+
+        self._entries.move_to_end(best_id)
+        return self._entries[best_id][2], vector
+
+    def add(self, vector: Sequence[float], value: CachedResponse) -> None:
+        """Store an answer under an already-normalized query vector."""
+        self._entries[self._next_id] = (time.monotonic() + self.ttl, list(vector), value)
+        self._next_id += 1
+
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _normalize(vector: Sequence[float]) -> List[float]:
+        norm = math.sqrt(sum(value * value for value in vector))
+        if norm == 0.0:
+            return list(vector)
+        return [value / norm for value in vector]
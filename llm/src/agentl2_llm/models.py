@@ -84,7 +84,7 @@ class LegalQuery(BaseModel):
 class LegalResponse(BaseModel):
     """Final response to legal query."""
     answer: str
-    sources: List[SearchSource]
+    sources: List[SearchSource] = Field(default_factory=list)
     confidence: float = Field(ge=0.0, le=1.0)
     related_keywords: List[str] = Field(default_factory=list)
     follow_up_questions: List[str] = Field(default_factory=list)
@@ -1,5 +1,6 @@
 """Pipeline components."""
 
 from .chatbot import LegalChatbot
+from .conversation_store import ConversationStore, RedisConversationStore
 
-__all__ = ["LegalChatbot"]
\ No newline at end of file
+__all__ = ["LegalChatbot", "ConversationStore", "RedisConversationStore"]
@@ -4,18 +4,39 @@ Main legal chatbot pipeline.
 
 from __future__ import annotations
 
+import re
 import time
 import asyncio
-from typing import Optional, Dict, Any
+from collections import OrderedDict
+from typing import AsyncIterator, Optional, Dict, Any, Tuple, Union
 
+import openai
 from loguru import logger
 
-from ..models import LegalResponse
+from ..models import LegalQuery, LegalResponse, QueryIntent, SearchResults
 from ..query.query_processor import QueryProcessor
 from ..search.search_coordinator import SearchCoordinator
 from ..response.response_generator import ResponseGenerator
 
 
+# Static parts of the error reply; only the error message changes per call
+_ERROR_TEMPLATE = """죄송합니다. 질문을 처리하는 중에 오류가 발생했습니다.
+
+오류 내용: {error_message}
+
+다음 사항을 확인해 주세요:
+- 네트워크 연결 상태
+- 질문 내용이 명확한지
+- 잠시 후 다시 시도해 보세요
+
+지속적인 문제가 발생하면 관리자에게 문의하시기 바랍니다."""
+
+_ERROR_FOLLOW_UPS = (
+    "다른 방식으로 질문해 보시겠습니까?",
+    "간단한 키워드로 검색해 보시겠습니까?"
+)
+
+
 class LegalChatbot:
     """Main legal chatbot that orchestrates the entire pipeline."""
 
@@ -25,7 +46,9 @@ class LegalChatbot:
         openai_model: str = "gpt-4",
         search_limit: int = 20,
         enable_internal_search: bool = True,
-        enable_external_search: bool = True
+        enable_external_search: bool = True,
+        openai_client: Optional[openai.AsyncOpenAI] = None,
+        search_coordinator: Optional[SearchCoordinator] = None
     ):
         """
         Initialize the legal chatbot.
@@ -36,20 +59,30 @@ class LegalChatbot:
             search_limit: Maximum number of search results
             enable_internal_search: Enable internal database search
             enable_external_search: Enable external search
+            openai_client: Shared OpenAI client (e.g. the pipeline's); the
+                caller keeps ownership
+            search_coordinator: Shared search coordinator; not closed by close()
         """
         self.query_processor = QueryProcessor()
-        self.search_coordinator = SearchCoordinator()
-        self.response_generator = ResponseGenerator(openai_api_key, openai_model)
+        self._owns_search_coordinator = search_coordinator is None
+        self.search_coordinator = search_coordinator or SearchCoordinator()
+        self.response_generator = ResponseGenerator(
+            openai_api_key, openai_model, client=openai_client
+        )
 
         self.search_limit = search_limit
         self.enable_internal_search = enable_internal_search
         self.enable_external_search = enable_external_search
 
+        # Queries currently being answered, keyed by whitespace-normalized text
+        self._inflight: Dict[str, asyncio.Task] = {}
+
         logger.info("Legal chatbot initialized")
 
     async def close(self):
         """Close all connections and cleanup resources."""
-        await self.search_coordinator.close()
+        if self._owns_search_coordinator:
+            await self.search_coordinator.close()
         logger.info("Legal chatbot closed")
 
     async def process_query(
@@ -66,44 +99,115 @@ class LegalChatbot:
 
         Returns:
             LegalResponse with answer, sources, and metadata
+
+        Identical context-free queries that arrive while one is already being
+        answered share that run instead of starting another.
         """
-        start_time = time.time()
+        if conversation_context is not None:
+            return await self._process_query(user_query)
+
+        key = re.sub(r'\s+', ' ', user_query.strip())
+        task = self._inflight.get(key)
+        if task is not None:
+            response = await asyncio.shield(task)
+            return response.model_copy(deep=True)
+
+        task = asyncio.create_task(self._process_query(user_query))
+        self._inflight[key] = task
+        task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shielded so a cancelled first caller does not cancel the waiters' run
+        return await asyncio.shield(task)
+
+    async def _process_query(self, user_query: str) -> LegalResponse:
+        """Run query analysis, search and response generation for one query."""
+        start_time = time.perf_counter()
 
         try:
             logger.info(f"Processing query: {user_query[:100]}...")
 
             # Step 1: Query Analysis
-            logger.info("Analyzing query intent and extracting keywords...")
-            legal_query = await self.query_processor.process(user_query)
-            logger.info(f"Query analysis complete - Intent: {legal_query.intent}, Keywords: {legal_query.keywords}")
-
-            # Step 2: Search Execution
-            logger.info("Executing search across available sources...")
-            search_results = await self.search_coordinator.search(
-                keywords=legal_query.keywords,
-                intent=legal_query.intent,
-                include_internal=self.enable_internal_search,
-                include_external=self.enable_external_search,
-                limit=self.search_limit
-            )
-            logger.info(f"Search complete - Found {search_results.total_count} results")
+            legal_query = await self._analyze_query(user_query)
 
-            # Step 3: Response Generation
-            logger.info("Generating response with verification...")
-            response = await self.response_generator.generate(
-                query=legal_query,
-                search_results=search_results.get_all_results()
+            return await self._answer_query(legal_query, start_time)
+
+        except Exception as e:
+            logger.error(f"Error processing query: {e}")
+            return self._generate_error_response(
+                user_query, str(e), processing_time=time.perf_counter() - start_time
             )
 
-            # Update processing time
-            response.processing_time = time.time() - start_time
+    async def stream_query(self, user_query: str) -> AsyncIterator[Union[str, LegalResponse]]:
+        """
+        Process a legal query, streaming the answer text as it is generated.
+
+        Yields text deltas, then the final LegalResponse (also on error).
+        """
+        start_time = time.perf_counter()
+        streamed = False
+
+        try:
+            logger.info(f"Streaming query: {user_query[:100]}...")
+
+            legal_query = await self._analyze_query(user_query)
+            search_results = await self._search(legal_query)
 
-            logger.info(f"Query processing complete in {response.processing_time:.2f}s")
-            return response
+            async for item in self.response_generator.generate_stream(
+                query=legal_query,
+                search_results=search_results.get_all_results()
+            ):
+                if isinstance(item, LegalResponse):
+                    item.processing_time = time.perf_counter() - start_time
+                    logger.info(f"Query streaming complete in {item.processing_time:.2f}s")
+                else:
+                    streamed = True
+                yield item
 
         except Exception as e:
-            logger.error(f"Error processing query: {e}")
-            return self._generate_error_response(user_query, str(e))
+            logger.error(f"Error streaming query: {e}")
+            error_response = self._generate_error_response(
+                user_query, str(e), processing_time=time.perf_counter() - start_time
+            )
+            if not streamed:
+                yield error_response.answer
+            yield error_response
+
+    async def _analyze_query(self, user_query: str) -> LegalQuery:
+        """Classify intent and extract keywords (local, no network calls)."""
+        logger.info("Analyzing query intent and extracting keywords...")
+        legal_query = await self.query_processor.process(user_query)
+        logger.info(f"Query analysis complete - Intent: {legal_query.intent}, Keywords: {legal_query.keywords}")
+        return legal_query
+
+    async def _answer_query(self, legal_query: LegalQuery, start_time: float) -> LegalResponse:
+        """Search for an analyzed query and generate the final response."""
+        # Step 2: Search Execution
+        search_results = await self._search(legal_query)
+
+        # Step 3: Response Generation
+        logger.info("Generating response with verification...")
+        response = await self.response_generator.generate(
+            query=legal_query,
+            search_results=search_results.get_all_results()
+        )
+
+        # Update processing time
+        response.processing_time = time.perf_counter() - start_time
+
+        logger.info(f"Query processing complete in {response.processing_time:.2f}s")
+        return response
+
+    async def _search(self, legal_query: LegalQuery) -> SearchResults:
+        """Search the enabled sources for an analyzed query."""
+        logger.info("Executing search across available sources...")
+        search_results = await self.search_coordinator.search(
+            keywords=legal_query.keywords,
+            intent=legal_query.intent,
+            include_internal=self.enable_internal_search,
+            include_external=self.enable_external_search,
+            limit=self.search_limit
+        )
+        logger.info(f"Search complete - Found {search_results.total_count} results")
+        return search_results
 
     async def get_status(self) -> Dict[str, Any]:
         """Get the current status of all chatbot components."""
@@ -140,31 +244,47 @@ class LegalChatbot:
         """
         semaphore = asyncio.Semaphore(max_concurrent)
 
-        async def process_single(query: str) -> LegalResponse:
-            async with semaphore:
-                return await self.process_query(query)
-
         logger.info(f"Processing {len(queries)} queries with max concurrency {max_concurrent}")
 
-        tasks = [process_single(query) for query in queries]
-        responses = await asyncio.gather(*tasks, return_exceptions=True)
-
-        # Handle exceptions
-        processed_responses = []
-        for i, response in enumerate(responses):
-            if isinstance(response, Exception):
-                logger.error(f"Error processing query {i}: {response}")
-                error_response = self._generate_error_response(queries[i], str(response))
-                processed_responses.append(error_response)
-            else:
-                processed_responses.append(response)
-
-        return processed_responses
-
-    def _generate_error_response(self, query: str, error_message: str) -> LegalResponse:
+        # Query analysis is local, so analyze every query up front and keep the
+        # semaphore slots for the network-bound search and generation stages
+        async def analyze_single(query: str) -> Tuple[LegalQuery | Exception, float]:
+            start_time = time.perf_counter()
+            try:
+                legal_query: LegalQuery | Exception = await self._analyze_query(query)
+            except Exception as e:
+                legal_query = e
+            return legal_query, time.perf_counter() - start_time
+
+        analyses = await asyncio.gather(*(analyze_single(query) for query in queries))
+
+        async def answer_single(index: int, query: str) -> LegalResponse:
+            legal_query, analysis_time = analyses[index]
+            # Backdated so processing_time includes analysis, as in process_query
+            start_time = time.perf_counter() - analysis_time
+            try:
+                if isinstance(legal_query, Exception):
+                    raise legal_query
+                async with semaphore:
+                    start_time = time.perf_counter() - analysis_time
+                    return await self._answer_query(legal_query, start_time)
+            except Exception as e:
+                logger.error(f"Error processing query {index}: {e}")
+                return self._generate_error_response(
+                    query, str(e), processing_time=time.perf_counter() - start_time
+                )
+
+        return list(await asyncio.gather(
+            *(answer_single(index, query) for index, query in enumerate(queries))
+        ))
+
+    def _generate_error_response(
+        self,
+        query: str,
+        error_message: str,
+        processing_time: float = 0.0
+    ) -> LegalResponse:
         """Generate an error response when processing fails."""
-        from ..models import LegalQuery, QueryIntent, SearchSource, SourceType
-
         # Create minimal query object
         error_query = LegalQuery(
             original_text=query,
@@ -174,24 +294,10 @@ class LegalChatbot:
         )
 
         return LegalResponse(
-            answer=f"""죄송합니다. 질문을 처리하는 중에 오류가 발생했습니다.
-
-오류 내용: {error_message}
-
-다음 사항을 확인해 주세요:
-- 네트워크 연결 상태
-- 질문 내용이 명확한지
-- 잠시 후 다시 시도해 보세요
-
-지속적인 문제가 발생하면 관리자에게 문의하시기 바랍니다.""",
-            sources=[],
+            answer=_ERROR_TEMPLATE.format(error_message=error_message),
             confidence=0.0,
-            related_keywords=[],
-            follow_up_questions=[
-                "다른 방식으로 질문해 보시겠습니까?",
-                "간단한 키워드로 검색해 보시겠습니까?"
-            ],
-            processing_time=1.0,
+            follow_up_questions=_ERROR_FOLLOW_UPS,
+            processing_time=processing_time,
             query=error_query
         )
 
@@ -199,24 +305,55 @@ class LegalChatbot:
 class ConversationManager:
     """Manages conversation context and history."""
 
-    def __init__(self, max_history: int = 10):
+    # Exchanges that feed the recent keyword/intent context
+    CONTEXT_WINDOW = 3
+
+    def __init__(self, max_history: int = 10, max_conversations: int = 10_000):
         self.max_history = max_history
-        self.conversations: Dict[str, list] = {}
+        self.max_conversations = max_conversations
+        # Least recently updated conversation first
+        self.conversations: OrderedDict[str, list] = OrderedDict()
+        # Recent keywords/intents per conversation, rebuilt on write
+        self._recent_context: Dict[str, Dict[str, list]] = {}
 
     def add_to_history(self, conversation_id: str, query: str, response: LegalResponse):
         """Add query and response to conversation history."""
         if conversation_id not in self.conversations:
             self.conversations[conversation_id] = []
+            while len(self.conversations) > self.max_conversations:
+                evicted_id, _ = self.conversations.popitem(last=False)
+                self._recent_context.pop(evicted_id, None)
+        else:
+            self.conversations.move_to_end(conversation_id)
 
-        self.conversations[conversation_id].append({
+        history = self.conversations[conversation_id]
+        history.append({
             "query": query,
             "response": response,
             "timestamp": time.time()
         })
 
         # Limit history size
-        if len(self.conversations[conversation_id]) > self.max_history:
-            self.conversations[conversation_id] = self.conversations[conversation_id][-self.max_history:]
+        if len(history) > self.max_history:
+            del history[:-self.max_history]
+
+        self._recent_context[conversation_id] = self._build_recent_context(history)
+
+    def _build_recent_context(self, history: list) -> Dict[str, list]:
+        """Collect keywords and intents from the last CONTEXT_WINDOW exchanges."""
+        recent_keywords: set[str] = set()
+        recent_intents: set[QueryIntent] = set()
+
+        for entry in history[-self.CONTEXT_WINDOW:]:
+            response = entry["response"]
+            if response.query:
+                recent_keywords.update(response.query.keywords)
+                recent_intents.add(response.query.intent)
+
+        return {
+            "recent_keywords": list(recent_keywords),
+            "recent_intents": list(recent_intents)
+        }
 
     def get_context(self, conversation_id: str) -> Optional[Dict[str, Any]]:
         """Get conversation context for improving responses."""
@@ -227,19 +364,10 @@ class ConversationManager:
         if not history:
             return None
 
-        # Extract context from recent conversation
-        recent_keywords = []
-        recent_intents = []
-
-        for entry in history[-3:]:  # Last 3 exchanges
-            response = entry["response"]
-            if response.query:
-                recent_keywords.extend(response.query.keywords)
-                recent_intents.append(response.query.intent)
-
+        recent = self._recent_context[conversation_id]
         return {
-            "recent_keywords": list(set(recent_keywords)),
-            "recent_intents": list(set(recent_intents)),
+            "recent_keywords": list(recent["recent_keywords"]),
+            "recent_intents": list(recent["recent_intents"]),
             "conversation_length": len(history),
             "last_query_time": history[-1]["timestamp"]
         }
@@ -247,4 +375,5 @@ class ConversationManager:
     def clear_conversation(self, conversation_id: str):
         """Clear conversation history for a given ID."""
         if conversation_id in self.conversations:
-            del self.conversations[conversation_id]
\ No newline at end of file
+            del self.conversations[conversation_id]
+        self._recent_context.pop(conversation_id, None)
\ No newline at end of file
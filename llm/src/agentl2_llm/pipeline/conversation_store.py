@@ -0,0 +1,65 @@
+"""
+Conversation context persistence shared across server workers.
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import Any, Optional
+
+from ..agents.base_agent import ConversationContext
+
+
+class ConversationStore(ABC):
+    """Backing store for conversation contexts outside the process."""
+
+    @abstractmethod
+    async def load(self, conversation_id: str) -> Optional[ConversationContext]:
+        """Return the stored context, or None if the conversation is unknown."""
+
+    @abstractmethod
+    async def save(self, context: ConversationContext) -> None:
+        """Persist the context under its conversation_id."""
+
+    @abstractmethod
+    async def delete(self, conversation_id: str) -> bool:
+        """Remove a conversation; returns whether it existed."""
+
+
+class RedisConversationStore(ConversationStore):
+    """
+    ConversationStore on top of a ``redis.asyncio`` client.
+
+    Agent response metadata (search results, citation packages) only matters
+    within the turn that produced it and is not JSON-serializable, so it is
+    dropped when saving. Writes are last-write-wins per conversation. The
+    client is owned by the caller (e.g. ``redis.asyncio.from_url(url)``).
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        ttl: int = 24 * 60 * 60,
+        key_prefix: str = "agentl2:conversation:"
+    ):
+        self.client = client
+        self.ttl = ttl
+        self.key_prefix = key_prefix
+
+    def _key(self, conversation_id: str) -> str:
+        return self.key_prefix + conversation_id
+
+    async def load(self, conversation_id: str) -> Optional[ConversationContext]:
+        raw = await self.client.get(self._key(conversation_id))
+        if raw is None:
+            return None
+        return ConversationContext.model_validate_json(raw)
+
+    async def save(self, context: ConversationContext) -> None:
+        payload = context.model_dump_json(
+            exclude={"agent_responses": {"__all__": {"metadata"}}}
+        )
+        await self.client.set(self._key(context.conversation_id), payload, ex=self.ttl)
+
+    async def delete(self, conversation_id: str) -> bool:
+        return bool(await self.client.delete(self._key(conversation_id)))
@@ -5,18 +5,24 @@ Enhanced Agent-based pipeline with comprehensive legal analysis.
 
 from __future__ import annotations
 
+import asyncio
+import re
 import time
 import uuid
 import inspect
-from dataclasses import is_dataclass, asdict
-from datetime import datetime
-from typing import Optional, Dict, Any, Callable, Awaitable, List
-
+from collections import OrderedDict
+from functools import cached_property
+from dataclasses import dataclass, is_dataclass, asdict
+from datetime import datetime, timezone
+from itertools import islice
+from typing import Optional, Dict, Any, Callable, Awaitable, AsyncIterator, Iterator, List, Tuple, Union
+
+import httpx
 import openai
 from pydantic import BaseModel
 from loguru import logger
 
-from ..agents.base_agent import ConversationContext, AgentAction, AgentResponse
+from ..agents.base_agent import BaseAgent, ConversationContext, AgentAction, AgentResponse
 from ..agents.facilitator_agent import FacilitatorAgent
 from ..agents.search_agent import SearchAgent
 from ..agents.analyst_agent import AnalystAgent
@@ -24,7 +30,116 @@ from ..agents.response_agent import ResponseAgent
 from ..agents.citation_agent import CitationAgent
 from ..agents.validator_agent import ValidatorAgent
 from ..search.search_coordinator import SearchCoordinator
+from ..cache.embedding_batcher import EmbeddingBatcher
 from ..models import LegalResponse, SearchSource, SearchResults, SourceType
+from .conversation_store import ConversationStore
+
+
+@dataclass(frozen=True, slots=True)
+class PipelineEvent:
+    """A single pipeline step; ``response`` is set only on the final event."""
+    agent: str
+    payload: Dict[str, Any]
+    response: Optional[LegalResponse] = None
+
+
+# Static reply text for the early-exit responses; only the turn limit and the
+# error message are filled in per call
+_CONTINUATION_FOLLOW_UPS = (
+    "조금 더 구체적인 상황을 알려주실 수 있을까요?",
+    "어떤 문제가 발생했는지 설명해 주실 수 있을까요?"
+)
+
+# Default follow-ups per intent; the first entry whose marker appears in the
+# extracted intent wins
+_INTENT_FOLLOW_UPS = (
+    (("법령",), (
+        "어떤 법령이나 조항을 검토해야 할지 함께 살펴볼까요?",
+        "관련 규제나 행정 해석이 필요한지도 알려주세요."
+    )),
+    (("소송", "분쟁"), (
+        "비슷한 분쟁 사례나 판례가 있는지 찾아드릴까요?",
+        "진행 중인 절차나 일정이 있다면 공유해 주실 수 있을까요?"
+    )),
+)
+
+# Suggested per-stage time budgets in seconds, for the stage_timeouts option
+DEFAULT_STAGE_TIMEOUTS = {
+    "facilitator": 3.0,
+    "search": 10.0,
+    "analyst": 8.0,
+    "response": 10.0,
+    "citation": 5.0,
+    "validator": 5.0,
+}
+
+# Replies used when a stage times out or its circuit is open; they mirror the
+# agents' own error responses so the rest of the pipeline carries on the same way
+_STAGE_FALLBACKS = {
+    "facilitator": (
+        AgentAction.CONTINUE_CONVERSATION,
+        "죄송합니다. 질문을 처리하는 중 오류가 발생했습니다. 다시 한 번 말씀해 주시겠어요?",
+        0.0
+    ),
+    "search": (
+        AgentAction.FORWARD_TO_RESPONSE,
+        "검색 중 오류가 발생했지만 가능한 정보로 답변을 생성하겠습니다.",
+        0.3
+    ),
+    "analyst": (
+        AgentAction.FORWARD_TO_RESPONSE,
+        "분석 중 오류가 발생했지만 가능한 정보로 답변을 생성하겠습니다.",
+        0.3
+    ),
+    "response": (
+        AgentAction.COMPLETE,
+        "답변 생성 중 오류가 발생했습니다. 잠시 후 다시 시도해 보세요.",
+        0.0
+    ),
+    "citation": (
+        AgentAction.FORWARD_TO_RESPONSE,
+        "인용 정보 생성 중 오류가 발생했습니다.",
+        0.3
+    ),
+    "validator": (
+        AgentAction.COMPLETE,
+        "검증 중 오류가 발생했습니다. 답변을 주의해서 참고하시기 바랍니다.",
+        0.3
+    ),
+}
+
+_JSON_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
+_CITATION_SOURCE_TYPES = {
+    "statute": SourceType.EXTERNAL_LAW,
+    "precedent": SourceType.EXTERNAL_PRECEDENT,
+    "administrative": SourceType.EXTERNAL_GENERAL,
+}
+
+_LIMIT_EXCEEDED_TEMPLATE = """대화 횟수가 최대 {max_turns}회를 초과했습니다.
+
+새로운 질문을 원하시면 새 대화를 시작해 주세요.
+
+더 나은 답변을 위해 다음을 권장합니다:
+- 보다 구체적인 질문으로 새로 시작하기
+- 관련 법령명이나 조문을 포함한 질문하기
+- 개별 사안에 대해 직접 문의하기"""
+
+_ERROR_TEMPLATE = """Sorry, an error occurred in the enhanced legal analysis process.
+
+Error: {error}
+
+Please try again:
+- Rephrase your question
+- Use simpler language
+- Try different keywords
+
+Contact administrator if problem persists."""
+
+_ERROR_FOLLOW_UPS = (
+    "Would you like to try a different approach?",
+    "Can you rephrase your question?"
+)
 
 
 class EnhancedAgentPipeline:
@@ -38,45 +153,187 @@ class EnhancedAgentPipeline:
         openai_api_key: str,
         openai_model: str = "gpt-4",
         temperature: float = 0.3,
-        max_conversation_turns: int = 5
+        max_conversation_turns: int = 5,
+        system_prompts: Optional[Dict[str, str]] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
+        embedding_model: str = "text-embedding-3-small",
+        max_active_conversations: int = 10_000,
+        speculative_search: bool = False,
+        conversation_store: Optional[ConversationStore] = None,
+        max_retries: int = 3,
+        openai_client: Optional[openai.AsyncOpenAI] = None,
+        search_coordinator: Optional[SearchCoordinator] = None,
+        review_confidence_threshold: Optional[float] = None,
+        stage_timeouts: Optional[Dict[str, float]] = None,
+        breaker_threshold: int = 5,
+        breaker_cooldown: float = 30.0,
+        max_concurrent_llm_calls: Optional[int] = None,
+        facilitator_cache_size: int = 0
     ):
-        """Initialize the enhanced agent pipeline."""
+        """
+        Initialize the enhanced agent pipeline.
+
+        system_prompts optionally overrides the built-in system prompt per agent
+        (keys: facilitator, search, analyst, response, citation, validator).
+        http_client lets the caller share one pooled connection to the OpenAI API;
+        the caller then remains responsible for closing it.
+        max_active_conversations caps the in-memory contexts; the least recently
+        used conversation is dropped first.
+        speculative_search starts the search agent alongside the facilitator; the
+        search then works from the previous turn's intent/keywords and is
+        cancelled when the facilitator does not forward to search.
+        conversation_store persists contexts outside the process (e.g. Redis) so
+        any worker can continue a conversation; the in-memory dict then acts as
+        a local copy that is refreshed at the start of each turn.
+        max_retries bounds the OpenAI client's own retries of transient failures
+        (rate limits, connection errors, 5xx) with exponential backoff that
+        honours Retry-After, before an agent falls back to its error path.
+        openai_client / search_coordinator share already-built instances (e.g.
+        with a LegalChatbot in the same process); shared instances are left
+        open by close().
+        review_confidence_threshold skips the validator agent when the response
+        agent's answer reaches this confidence, and the citation agent too when
+        the answer has no unresolved [REF-] markers and carries its own sources;
+        None (default) always runs the full review.
+        stage_timeouts maps a stage name (facilitator, search, analyst, response,
+        citation, validator) to a time budget in seconds, e.g.
+        DEFAULT_STAGE_TIMEOUTS. A stage that overruns is cancelled and replaced
+        by the agent's usual error reply; after breaker_threshold consecutive
+        timeouts the stage is skipped the same way for breaker_cooldown seconds.
+        max_concurrent_llm_calls caps the chat completions in flight across all
+        agents and conversations, so bursts queue locally instead of tripping
+        the provider's rate limit; None (default) leaves them uncapped.
+        facilitator_cache_size keeps that many facilitator results for opening
+        messages (the only ones analysed without history), so a repeated first
+        question skips the facilitator call; 0 (default) disables it.
+        """
 
-        self.openai_client = openai.AsyncOpenAI(api_key=openai_api_key)
-        self.search_coordinator = SearchCoordinator()
+        if openai_client is None:
+            openai_client = openai.AsyncOpenAI(
+                api_key=openai_api_key,
+                http_client=http_client,
+                max_retries=max_retries
+            )
+            self._owns_http_client = http_client is None
+        else:
+            self._owns_http_client = False
+        self.openai_client = openai_client
+        self.embedding_model = embedding_model
+        self._embed_batcher = EmbeddingBatcher(self._embed_batch)
+        self._owns_search_coordinator = search_coordinator is None
+        self.search_coordinator = search_coordinator or SearchCoordinator()
         self.max_conversation_turns = max_conversation_turns
-
-        # Initialize agents
-        agent_kwargs = {
+        self.max_active_conversations = max_active_conversations
+        self.speculative_search = speculative_search
+        self.conversation_store = conversation_store
+        self.review_confidence_threshold = review_confidence_threshold
+        self.stage_timeouts = stage_timeouts or {}
+        self.breaker_threshold = breaker_threshold
+        self.breaker_cooldown = breaker_cooldown
+        # Per stage: consecutive timeouts and the monotonic time the circuit reopens
+        self._breakers: Dict[str, Tuple[int, float]] = {}
+
+        # Agents are built on first use (see the properties below), so paths
+        # that end early, e.g. at clarification, never construct the rest
+        self._agent_kwargs = {
             "openai_client": self.openai_client,
             "model": openai_model,
-            "temperature": temperature
+            "temperature": temperature,
+            "llm_semaphore": (
+                asyncio.Semaphore(max_concurrent_llm_calls)
+                if max_concurrent_llm_calls else None
+            )
         }
+        self._system_prompts = system_prompts or {}
+
+        # Active conversations, least recently used first
+        self.conversations: OrderedDict[str, ConversationContext] = OrderedDict()
+
+        # Facilitator results for opening messages, least recently used first
+        self.facilitator_cache_size = facilitator_cache_size
+        self._facilitator_cache: OrderedDict[str, AgentResponse] = OrderedDict()
+
+        # Messages currently being processed, keyed by conversation id and
+        # whitespace-normalized text
+        self._inflight: Dict[Tuple[Optional[str], str], asyncio.Task] = {}
+
+        # Store deletes started by clear_conversation; referenced until done
+        self._store_deletes: set[asyncio.Task] = set()
 
-        # 기존 에이전트
-        self.facilitator = FacilitatorAgent(**agent_kwargs)
-        self.search_agent = SearchAgent(
+        logger.info("Enhanced agent pipeline initialized with 6 specialized agents")
+
+    # 기존 에이전트
+    @cached_property
+    def facilitator(self) -> FacilitatorAgent:
+        return FacilitatorAgent(
+            system_prompt=self._system_prompts.get("facilitator"),
+            **self._agent_kwargs
+        )
+
+    @cached_property
+    def search_agent(self) -> SearchAgent:
+        return SearchAgent(
             search_coordinator=self.search_coordinator,
-            **agent_kwargs
+            system_prompt=self._system_prompts.get("search"),
+            **self._agent_kwargs
         )
-        self.response_agent = ResponseAgent(**agent_kwargs)
 
-        # 확장 에이전트
-        self.analyst = AnalystAgent(**agent_kwargs)
-        self.citation_agent = CitationAgent(**agent_kwargs)
-        self.validator = ValidatorAgent(**agent_kwargs)
+    @cached_property
+    def response_agent(self) -> ResponseAgent:
+        return ResponseAgent(
+            system_prompt=self._system_prompts.get("response"),
+            **self._agent_kwargs
+        )
 
-        # Active conversations
-        self.conversations: Dict[str, ConversationContext] = {}
+    # 확장 에이전트
+    @cached_property
+    def analyst(self) -> AnalystAgent:
+        return AnalystAgent(
+            system_prompt=self._system_prompts.get("analyst"),
+            **self._agent_kwargs
+        )
 
-        logger.info("Enhanced agent pipeline initialized with 6 specialized agents")
+    @cached_property
+    def citation_agent(self) -> CitationAgent:
+        return CitationAgent(
+            system_prompt=self._system_prompts.get("citation"),
+            **self._agent_kwargs
+        )
+
+    @cached_property
+    def validator(self) -> ValidatorAgent:
+        return ValidatorAgent(
+            system_prompt=self._system_prompts.get("validator"),
+            **self._agent_kwargs
+        )
 
     async def close(self):
         """Close all connections and cleanup resources."""
-        await self.search_coordinator.close()
-        await self.openai_client.close()
+        if self._owns_search_coordinator:
+            await self.search_coordinator.close()
+        if self._owns_http_client:
+            await self.openai_client.close()
         logger.info("Enhanced agent pipeline closed")
 
+    async def warmup(self) -> None:
+        """Open the OpenAI connection ahead of the first user request."""
+        # A model listing is free and goes through the same pooled client,
+        # so the TLS/HTTP2 handshake is paid here rather than by a user
+        await self.openai_client.models.list()
+        logger.info("Enhanced agent pipeline warmed up")
+
+    async def embed(self, text: str) -> List[float]:
+        """Embed text with the OpenAI embeddings API (used for semantic caching)."""
+        # Concurrent calls are coalesced into one API request
+        return await self._embed_batcher.submit(text)
+
+    async def _embed_batch(self, texts: List[str]) -> List[List[float]]:
+        response = await self.openai_client.embeddings.create(
+            model=self.embedding_model,
+            input=texts
+        )
+        return [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
+
     async def process_message(
         self,
         user_message: str,
@@ -87,263 +344,433 @@ class EnhancedAgentPipeline:
         Process a user message through the enhanced 6-agent pipeline.
 
         Flow: 전달자 → 검색자 → 분석가 → 응답자 → 인용자 → 검증자
+
+        Without an event_handler, an identical message for the same conversation
+        (or without one) that arrives while it is already being processed shares
+        that run instead of starting another pipeline.
+        """
+
+        if event_handler is not None:
+            return await self._process_message(user_message, conversation_id, event_handler)
+
+        key = (conversation_id or None, re.sub(r'\s+', ' ', user_message.strip()))
+        task = self._inflight.get(key)
+        if task is not None:
+            response = await asyncio.shield(task)
+            return response.model_copy(deep=True)
+
+        task = asyncio.create_task(self._process_message(user_message, conversation_id))
+        self._inflight[key] = task
+        task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shielded so a cancelled first caller does not cancel the waiters' run
+        return await asyncio.shield(task)
+
+    async def _process_message(
+        self,
+        user_message: str,
+        conversation_id: Optional[str] = None,
+        event_handler: Optional[Callable[[str, Dict[str, Any]], Awaitable[None]]] = None
+    ) -> LegalResponse:
+        """Drain process_message_stream, forwarding events to the handler."""
+        final_response: Optional[LegalResponse] = None
+
+        # Step payloads are only built when a handler will receive them
+        events = self.process_message_stream(
+            user_message, conversation_id, include_steps=event_handler is not None
+        )
+        async for event in events:
+            await self._emit_event(event_handler, event)
+            if event.response is not None:
+                final_response = event.response
+
+        return final_response
+
+    async def process_message_stream(
+        self,
+        user_message: str,
+        conversation_id: Optional[str] = None,
+        include_steps: bool = True
+    ) -> AsyncIterator[PipelineEvent]:
         """
+        Process a user message and yield each agent step as it completes.
 
-        start_time = time.time()
+        The last event is a "pipeline" event whose ``response`` holds the final
+        LegalResponse (completed, limit_exceeded or error). With include_steps
+        False only that event is yielded, and no step payloads are built.
+        """
+
+        # perf_counter is monotonic, so clock adjustments cannot skew durations
+        start_time = time.perf_counter()
 
         if not conversation_id:
-            conversation_id = str(uuid.uuid4())
+            conversation_id = uuid.uuid4().hex
 
-        context = self._get_or_create_context(conversation_id)
+        context = await self._load_context(conversation_id)
 
         logger.info(f"Processing message through enhanced pipeline: {user_message[:50]}...")
 
         try:
-            context.user_messages.append(user_message)
-
-            if len(context.user_messages) > self.max_conversation_turns:
+            # Rejected messages are not recorded, so the history stays bounded
+            # by max_conversation_turns however often the limit is hit
+            if len(context.user_messages) >= self.max_conversation_turns:
                 limit_response = self._generate_limit_exceeded_response(conversation_id)
-                await self._emit_event(
-                    event_handler,
+                limit_response.processing_time = time.perf_counter() - start_time
+                yield self._make_event(
                     "pipeline",
                     {
                         "stage": "limit_exceeded",
                         "response": self._serialize_legal_response(limit_response),
                         "context": self._summarize_context(context)
-                    }
+                    },
+                    response=limit_response
                 )
-                return limit_response
+                return
 
-            final_response = await self._execute_enhanced_pipeline(
-                user_message,
-                context,
-                event_handler=event_handler
-            )
+            context.user_messages.append(user_message)
 
-            self.conversations[conversation_id] = context
+            final_response: Optional[LegalResponse] = None
+            steps = self._execute_enhanced_pipeline(user_message, context, include_steps)
+            try:
+                async for item in steps:
+                    if isinstance(item, LegalResponse):
+                        final_response = item
+                    else:
+                        yield item
+            finally:
+                # Propagate an early close to the running stage so it can cancel its agents
+                await steps.aclose()
+                self._compact_metadata(context)
 
-            final_response.processing_time = time.time() - start_time
+            if self.conversation_store is not None:
+                await self.conversation_store.save(context)
+
+            final_response.processing_time = time.perf_counter() - start_time
+
+            logger.info(f"Enhanced pipeline completed in {final_response.processing_time:.2f}s")
 
-            await self._emit_event(
-                event_handler,
+            yield self._make_event(
                 "pipeline",
                 {
                     "stage": "completed",
                     "response": self._serialize_legal_response(final_response),
                     "context": self._summarize_context(context)
-                }
+                },
+                response=final_response
             )
 
-            logger.info(f"Enhanced pipeline completed in {final_response.processing_time:.2f}s")
-            return final_response
-
         except Exception as e:
             logger.error(f"Error in enhanced pipeline: {e}")
             error_response = self._generate_error_response(user_message, str(e))
-            await self._emit_event(
-                event_handler,
+            error_response.processing_time = time.perf_counter() - start_time
+            yield self._make_event(
                 "pipeline",
                 {
                     "stage": "error",
                     "error": str(e),
                     "response": self._serialize_legal_response(error_response),
                     "context": self._summarize_context(context)
-                }
+                },
+                response=error_response
             )
-            return error_response
 
     async def _execute_enhanced_pipeline(
         self,
         user_message: str,
         context: ConversationContext,
-        event_handler: Optional[Callable[[str, Dict[str, Any]], Awaitable[None]]] = None
-    ) -> LegalResponse:
-        """Execute the complete 6-agent pipeline."""
-
-        # Step 1: 전달자 Agent - 의도파악 및 키워드 추출
-        logger.info("Step 1: Facilitator Agent processing")
-        facilitator_input = self._build_agent_input(user_message, context)
-        facilitator_response = await self.facilitator.process(user_message, context)
-        context.agent_responses.append(facilitator_response)
-
-        self._ingest_agent_signal(context, facilitator_response)
-
-        await self._emit_event(
-            event_handler,
-            "facilitator",
-            {
-                "input": facilitator_input,
-                "output": self._summarize_agent_response(facilitator_response),
-                "context": self._summarize_context(context)
-            }
-        )
-
-        if facilitator_response.action == AgentAction.REQUEST_CLARIFICATION:
-            clarification_response = LegalResponse(
-                answer=facilitator_response.message,
-                sources=[],
-                confidence=facilitator_response.confidence,
-                related_keywords=facilitator_response.keywords,
-                follow_up_questions=facilitator_response.clarification_options,
-                query=None
-            )
-            await self._emit_event(
-                event_handler,
-                "pipeline",
-                {
-                    "stage": "clarification_needed",
-                    "response": self._serialize_legal_response(clarification_response),
-                    "context": self._summarize_context(context)
-                }
-            )
-            return clarification_response
-
-        if facilitator_response.action == AgentAction.CONTINUE_CONVERSATION:
-            continuation_response = LegalResponse(
-                answer=facilitator_response.message,
-                sources=[],
-                confidence=facilitator_response.confidence,
-                related_keywords=facilitator_response.keywords,
-                follow_up_questions=[
-                    "조금 더 구체적인 상황을 알려주실 수 있을까요?",
-                    "어떤 문제가 발생했는지 설명해 주실 수 있을까요?"
-                ],
-                query=None
+        include_steps: bool = True
+    ) -> AsyncIterator[Union[PipelineEvent, LegalResponse]]:
+        """Execute the complete 6-agent pipeline, yielding step events then the final response."""
+
+        # Step 1 (+ optional speculative Step 2)
+        search_task: Optional[asyncio.Task] = None
+        if self.speculative_search:
+            search_task = asyncio.create_task(
+                self._run_stage("search", self.search_agent, user_message, context)
             )
-            await self._emit_event(
-                event_handler,
-                "pipeline",
-                {
-                    "stage": "additional_context_required",
-                    "response": self._serialize_legal_response(continuation_response),
-                    "context": self._summarize_context(context)
-                }
-            )
-            return continuation_response
 
-        # Step 2: 검색자 Agent - 다중라운드 검색 및 보완 검색
-        logger.info("Step 2: Search Agent processing")
-        search_input = self._build_agent_input(user_message, context)
-        search_response = await self.search_agent.process(user_message, context)
+        try:
+            # Step 1: 전달자 Agent - 의도파악 및 키워드 추출
+            logger.info("Step 1: Facilitator Agent processing")
+            facilitator_input = self._build_agent_input(user_message, context) if include_steps else None
+            facilitator_response = await self._run_facilitator(user_message, context)
+            context.agent_responses.append(facilitator_response)
+
+            self._ingest_agent_signal(context, facilitator_response)
+
+            if include_steps:
+                yield self._agent_step_event("facilitator", facilitator_input, facilitator_response, context)
+
+            if facilitator_response.action == AgentAction.REQUEST_CLARIFICATION:
+                clarification_response = LegalResponse(
+                    answer=facilitator_response.message,
+                    confidence=facilitator_response.confidence,
+                    related_keywords=facilitator_response.keywords,
+                    follow_up_questions=facilitator_response.clarification_options,
+                    query=None
+                )
+                if include_steps:
+                    yield self._make_event(
+                        "pipeline",
+                        {
+                            "stage": "clarification_needed",
+                            "response": self._serialize_legal_response(clarification_response),
+                            "context": self._summarize_context(context)
+                        }
+                    )
+                yield clarification_response
+                return
+
+            if facilitator_response.action == AgentAction.CONTINUE_CONVERSATION:
+                continuation_response = LegalResponse(
+                    answer=facilitator_response.message,
+                    confidence=facilitator_response.confidence,
+                    related_keywords=facilitator_response.keywords,
+                    follow_up_questions=_CONTINUATION_FOLLOW_UPS,
+                    query=None
+                )
+                if include_steps:
+                    yield self._make_event(
+                        "pipeline",
+                        {
+                            "stage": "additional_context_required",
+                            "response": self._serialize_legal_response(continuation_response),
+                            "context": self._summarize_context(context)
+                        }
+                    )
+                yield continuation_response
+                return
+
+            # Step 2: 검색자 Agent - 다중라운드 검색 및 보완 검색
+            logger.info("Step 2: Search Agent processing")
+            search_input = self._build_agent_input(user_message, context) if include_steps else None
+            if search_task is not None:
+                search_response = await search_task
+            else:
+                search_response = await self._run_stage("search", self.search_agent, user_message, context)
+        finally:
+            if search_task is not None:
+                # No-op once awaited; otherwise drops the unneeded speculative search
+                search_task.cancel()
+                await asyncio.gather(search_task, return_exceptions=True)
+
         context.agent_responses.append(search_response)
 
         self._ingest_agent_signal(context, search_response)
 
-        await self._emit_event(
-            event_handler,
-            "search",
-            {
-                "input": search_input,
-                "output": self._summarize_agent_response(search_response),
-                "context": self._summarize_context(context)
-            }
+        if include_steps:
+            yield self._agent_step_event("search", search_input, search_response, context)
+
+        # Step 3-4: 분석가 ∥ 응답자 - the response agent only needs the search
+        # results, so it drafts the answer while the analyst works. Citation and
+        # validation read both outputs and stay sequential.
+        logger.info("Step 3-4: Analyst and Response Agents processing in parallel")
+        # Both agents start from the same context, so they share one input snapshot
+        analysis_input = response_input = self._build_agent_input(user_message, context) if include_steps else None
+        analysis_task = asyncio.create_task(
+            self._run_stage("analyst", self.analyst, user_message, context)
+        )
+        response_task = asyncio.create_task(
+            self._run_stage("response", self.response_agent, user_message, context)
         )
 
-        # Step 3: 분석가 Agent - 법적 분석
-        logger.info("Step 3: Analyst Agent processing")
-        analysis_input = self._build_agent_input(user_message, context)
-        analysis_response = await self.analyst.process(user_message, context)
-        context.agent_responses.append(analysis_response)
+        try:
+            analysis_response = await analysis_task
+            # Analyst first: the citation agent reads the latest message-bearing response
+            context.agent_responses.append(analysis_response)
 
-        self._ingest_agent_signal(context, analysis_response)
+            self._ingest_agent_signal(context, analysis_response)
 
-        await self._emit_event(
-            event_handler,
-            "analyst",
-            {
-                "input": analysis_input,
-                "output": self._summarize_agent_response(analysis_response),
-                "context": self._summarize_context(context)
-            }
-        )
+            if include_steps:
+                yield self._agent_step_event("analyst", analysis_input, analysis_response, context)
+
+            response_agent_response = await response_task
+        finally:
+            await self._cancel_pending(analysis_task, response_task)
 
-        # Step 4: 응답자 Agent - 최종 답변 생성
-        logger.info("Step 4: Response Agent processing")
-        response_input = self._build_agent_input(user_message, context)
-        response_agent_response = await self.response_agent.process(user_message, context)
         context.agent_responses.append(response_agent_response)
 
         self._ingest_agent_signal(context, response_agent_response)
 
-        await self._emit_event(
-            event_handler,
-            "response",
-            {
-                "input": response_input,
-                "output": self._summarize_agent_response(response_agent_response),
-                "context": self._summarize_context(context)
-            }
-        )
+        if include_steps:
+            yield self._agent_step_event("response", response_input, response_agent_response, context)
 
-        # Step 5: 인용자 Agent - 참조 및 출처 관리
-        logger.info("Step 5: Citation Agent processing")
-        citation_input = self._build_agent_input(user_message, context)
-        citation_response = await self.citation_agent.process(user_message, context)
-        context.agent_responses.append(citation_response)
+        skips_validation = self._skips_validation(response_agent_response)
+        if skips_validation and self._has_resolved_citations(response_agent_response):
+            logger.info("Skipping citation and validation for a high-confidence answer")
+            final_agent_response = response_agent_response
+        else:
+            # Step 5: 인용자 Agent - 참조 및 출처 관리
+            logger.info("Step 5: Citation Agent processing")
+            citation_input = self._build_agent_input(user_message, context) if include_steps else None
+            citation_response = await self._run_stage("citation", self.citation_agent, user_message, context)
+            context.agent_responses.append(citation_response)
 
-        self._ingest_agent_signal(context, citation_response)
+            self._ingest_agent_signal(context, citation_response)
 
-        await self._emit_event(
-            event_handler,
-            "citation",
-            {
-                "input": citation_input,
-                "output": self._summarize_agent_response(citation_response),
-                "context": self._summarize_context(context)
-            }
-        )
+            if include_steps:
+                yield self._agent_step_event("citation", citation_input, citation_response, context)
 
-        # Step 6: 검증자 Agent - 종합 검증 및 품질관리
-        logger.info("Step 6: Validator Agent processing")
-        validator_input = self._build_agent_input(user_message, context)
-        validation_response = await self.validator.process(user_message, context)
-        context.agent_responses.append(validation_response)
+            if skips_validation:
+                logger.info("Skipping validation for a high-confidence answer")
+                final_agent_response = response_agent_response.model_copy(update={
+                    "message": self._attach_citations(response_agent_response.message, citation_response)
+                })
+            else:
+                # Step 6: 검증자 Agent - 종합 검증 및 품질관리
+                logger.info("Step 6: Validator Agent processing")
+                validator_input = self._build_agent_input(user_message, context) if include_steps else None
+                validation_response = await self._run_stage("validator", self.validator, user_message, context)
+                context.agent_responses.append(validation_response)
 
-        self._ingest_agent_signal(context, validation_response)
+                self._ingest_agent_signal(context, validation_response)
 
-        await self._emit_event(
-            event_handler,
-            "validator",
-            {
-                "input": validator_input,
-                "output": self._summarize_agent_response(validation_response),
-                "context": self._summarize_context(context)
-            }
-        )
+                if include_steps:
+                    yield self._agent_step_event("validator", validator_input, validation_response, context)
 
-        final_answer = validation_response.message
-        sources = self._extract_sources(context)
-        confidence = validation_response.confidence
-        related_keywords = self._extract_related_keywords(context)
-        follow_ups = self._extract_follow_up_questions(context)
+                final_agent_response = validation_response
 
-        return LegalResponse(
-            answer=final_answer,
+        sources, related_keywords, follow_ups = self._extract_response_details(context)
+
+        yield LegalResponse(
+            answer=final_agent_response.message,
             sources=sources,
-            confidence=confidence,
+            confidence=final_agent_response.confidence,
             related_keywords=related_keywords,
             follow_up_questions=follow_ups,
             query=None
         )
 
+    async def _run_stage(
+        self,
+        stage: str,
+        agent: BaseAgent,
+        user_message: str,
+        context: ConversationContext
+    ) -> AgentResponse:
+        """Run one agent within its time budget, behind its circuit breaker."""
+        failures, open_until = self._breakers.get(stage, (0, 0.0))
+        if failures >= self.breaker_threshold and time.monotonic() < open_until:
+            logger.warning(f"{stage} stage skipped: circuit open after {failures} timeouts")
+            return self._stage_fallback(stage, "circuit open")
+
+        timeout = self.stage_timeouts.get(stage)
+        try:
+            response = await asyncio.wait_for(agent.process(user_message, context), timeout)
+        except asyncio.TimeoutError:
+            failures += 1
+            self._breakers[stage] = (failures, time.monotonic() + self.breaker_cooldown)
+            logger.warning(f"{stage} stage timed out after {timeout}s ({failures} in a row)")
+            return self._stage_fallback(stage, f"timed out after {timeout}s")
+
+        self._breakers.pop(stage, None)
+        return response
+
+    async def _run_facilitator(self, user_message: str, context: ConversationContext) -> AgentResponse:
+        """Run the facilitator, reusing its result for a repeated opening message."""
+        # With no earlier turns the facilitator sees only the message itself
+        if (
+            not self.facilitator_cache_size
+            or len(context.user_messages) > 1
+            or context.agent_responses
+        ):
+            return await self._run_stage("facilitator", self.facilitator, user_message, context)
+
+        key = re.sub(r'\s+', ' ', user_message.strip())
+        cached = self._facilitator_cache.get(key)
+        if cached is not None:
+            self._facilitator_cache.move_to_end(key)
+            return cached.model_copy(deep=True, update={"timestamp": datetime.now()})
+
+        response = await self._run_stage("facilitator", self.facilitator, user_message, context)
+        # Error and timeout replies carry zero confidence and are not kept
+        if response.confidence > 0 and "error" not in response.metadata:
+            self._facilitator_cache[key] = response.model_copy(deep=True)
+            while len(self._facilitator_cache) > self.facilitator_cache_size:
+                self._facilitator_cache.popitem(last=False)
+        return response
+
+    def _stage_fallback(self, stage: str, error: str) -> AgentResponse:
+        action, message, confidence = _STAGE_FALLBACKS[stage]
+        return AgentResponse(
+            action=action,
+            message=message,
+            confidence=confidence,
+            metadata={"error": error}
+        )
+
+    def _skips_validation(self, response: AgentResponse) -> bool:
+        """Whether the answer is confident enough to skip the validator."""
+        return (
+            self.review_confidence_threshold is not None
+            and bool(response.message)
+            and response.confidence >= self.review_confidence_threshold
+        )
+
+    @staticmethod
+    def _has_resolved_citations(response: AgentResponse) -> bool:
+        """Whether the answer needs no citation agent: sources and no [REF-] placeholders."""
+        return bool(response.metadata.get("sources")) and "[REF-" not in response.message
+
+    @staticmethod
+    def _attach_citations(answer: str, citation_response: AgentResponse) -> str:
+        """Append the formatted citations the way the validator's final answer does."""
+        citation_package = citation_response.metadata.get("citation_package")
+        if citation_package is None:
+            return answer
+        return "\n".join((answer, "\n---\n", citation_package.formatted_citations))
+
+    def _agent_step_event(
+        self,
+        agent: str,
+        agent_input: Dict[str, Any],
+        response: AgentResponse,
+        context: ConversationContext
+    ) -> PipelineEvent:
+        return self._make_event(
+            agent,
+            {
+                "input": agent_input,
+                "output": self._summarize_agent_response(response),
+                "context": self._summarize_context(context)
+            }
+        )
+
+    async def _cancel_pending(self, *tasks: asyncio.Task) -> None:
+        """Cancel unfinished agent tasks and wait until they have unwound."""
+        pending = [task for task in tasks if not task.done()]
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    def _make_event(
+        self,
+        agent: str,
+        payload: Dict[str, Any],
+        response: Optional[LegalResponse] = None
+    ) -> PipelineEvent:
+        event_payload = dict(payload) if isinstance(payload, dict) else {"value": payload}
+        if "timestamp" not in event_payload:
+            # Aware UTC time, minus its "+00:00" offset, in the existing "...Z" shape
+            event_payload["timestamp"] = (
+                datetime.now(timezone.utc).isoformat(timespec="milliseconds")[:-6] + "Z"
+            )
+        return PipelineEvent(agent=agent, payload=event_payload, response=response)
+
     async def _emit_event(
         self,
         handler: Optional[Callable[[str, Dict[str, Any]], Awaitable[None]]],
-        agent: str,
-        payload: Dict[str, Any]
+        event: PipelineEvent
     ) -> None:
         if not handler:
             return
 
-        event_payload = dict(payload) if isinstance(payload, dict) else {"value": payload}
-        event_payload.setdefault("timestamp", datetime.utcnow().isoformat() + "Z")
-
         try:
-            result = handler(agent, event_payload)
+            result = handler(event.agent, event.payload)
             if inspect.isawaitable(result):
                 await result
         except Exception as exc:
-            logger.warning(f"Event handler error for {agent}: {exc}")
+            logger.warning(f"Event handler error for {event.agent}: {exc}")
 
     def _build_agent_input(self, user_message: str, context: ConversationContext) -> Dict[str, Any]:
         priority_memory = self._ensure_priority_memory(context)
@@ -393,6 +820,10 @@ class EnhancedAgentPipeline:
         return {key: self._serialize_value(value) for key, value in metadata.items()}
 
     def _serialize_value(self, value: Any):
+        # Exact-type check: most metadata values are plain scalars, and enum or
+        # other subclasses still go through the ladder below as before
+        if type(value) in _JSON_SCALAR_TYPES:
+            return value
         if isinstance(value, SearchResults):
             return self._serialize_search_results(value)
         if isinstance(value, BaseModel):
@@ -419,9 +850,7 @@ class EnhancedAgentPipeline:
                 {
                     "title": item.title,
                     "url": item.source.url,
-                    "source_type": item.source.source_type.value
-                    if hasattr(item.source.source_type, "value")
-                    else str(item.source.source_type),
+                    "source_type": item.source.source_type.value,
                     "relevance_score": item.relevance_score,
                 }
                 for item in results.get_all_results()[:3]
@@ -435,9 +864,7 @@ class EnhancedAgentPipeline:
                 {
                     "title": source.title,
                     "url": source.url,
-                    "source_type": source.source_type.value
-                    if hasattr(source.source_type, "value")
-                    else str(source.source_type),
+                    "source_type": source.source_type.value,
                     "confidence": source.confidence,
                     "excerpt": source.excerpt,
                     "date": source.date.isoformat() if source.date else None,
@@ -505,98 +932,124 @@ class EnhancedAgentPipeline:
 
     @staticmethod
     def _deduplicate_sequence(items: List[str]) -> List[str]:
-        seen: set[str] = set()
-        deduplicated: List[str] = []
-        for item in items:
-            if item not in seen:
-                seen.add(item)
-                deduplicated.append(item)
-        return deduplicated
-
-
-    def _map_citation_type_to_source_type(self, citation_type: str) -> SourceType:
-        mapping = {
-            "statute": SourceType.EXTERNAL_LAW,
-            "precedent": SourceType.EXTERNAL_PRECEDENT,
-            "administrative": SourceType.EXTERNAL_GENERAL,
-        }
-        return mapping.get(citation_type, SourceType.EXTERNAL_GENERAL)
+        # dict keys keep first-seen order
+        return list(dict.fromkeys(items))
 
-    def _extract_sources(self, context: ConversationContext) -> list[SearchSource]:
-        """Extract sources from context."""
-        sources = []
 
-        for response in context.agent_responses:
-            if response.metadata:
-                # Citation agent sources
-                if "citation_package" in response.metadata:
-                    citation_package = response.metadata["citation_package"]
-                    for citation in citation_package.citations:
-                        source = SearchSource(
-                            url=citation.source_url,
-                            title=citation.title,
-                            source_type=self._map_citation_type_to_source_type(citation.citation_type),
-                            confidence=0.8,
-                            excerpt=citation.content[:150]
-                        )
-                        sources.append(source)
-
-                # Search results sources
-                elif "search_results" in response.metadata:
-                    search_results = response.metadata["search_results"]
-                    for result in search_results.get_all_results()[:5]:  # Top 5
-                        sources.append(result.source)
-
-        return sources[:10]  # Limit to 10 sources
-
-    def _extract_related_keywords(self, context: ConversationContext) -> list[str]:
-        """Extract related keywords from context."""
-        all_keywords = []
+    @staticmethod
+    def _map_citation_type_to_source_type(citation_type: str) -> SourceType:
+        return _CITATION_SOURCE_TYPES.get(citation_type, SourceType.EXTERNAL_GENERAL)
+
+    def _extract_response_details(
+        self,
+        context: ConversationContext
+    ) -> Tuple[list[SearchSource], list[str], list[str]]:
+        """Collect sources, related keywords and follow-up questions in one pass."""
+        sources: list[SearchSource] = []
+        keywords: list[str] = []
+        follow_ups: list[str] = []
 
         for response in context.agent_responses:
-            if response.keywords:
-                all_keywords.extend(response.keywords)
+            keywords.extend(response.keywords)
+            # Look for follow-up questions in agent responses
+            follow_ups.extend(response.clarification_options)
+            if response.metadata and len(sources) < 10:  # Limit to 10 sources
+                # Lazy, so no SearchSource is built past the limit
+                sources.extend(islice(self._iter_sources(response), 10 - len(sources)))
+
+        # Default follow-ups based on intent
+        if context.extracted_intent:
+            intent = context.extracted_intent.lower()
+            for markers, intent_follow_ups in _INTENT_FOLLOW_UPS:
+                if any(marker in intent for marker in markers):
+                    follow_ups.extend(intent_follow_ups)
+                    break
+
+        # Remove duplicates while preserving order; agents often repeat the
+        # same keywords and clarifications across stages
+        return (
+            sources,
+            self._deduplicate_sequence(keywords)[:10],  # Limit to 10
+            self._deduplicate_sequence(follow_ups)[:4]  # Limit to 4
+        )
+
+    def _iter_sources(self, response: AgentResponse) -> Iterator[SearchSource]:
+        """Yield the sources recorded in one agent response's metadata."""
+        # Citation agent sources
+        if "citation_package" in response.metadata:
+            citation_package = response.metadata["citation_package"]
+            for citation in citation_package.citations:
+                yield SearchSource(
+                    url=citation.source_url,
+                    title=citation.title,
+                    source_type=self._map_citation_type_to_source_type(citation.citation_type),
+                    confidence=0.8,
+                    excerpt=citation.content[:150]
+                )
 
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_keywords = []
-        for keyword in all_keywords:
-            if keyword not in seen:
-                seen.add(keyword)
-                unique_keywords.append(keyword)
+        # Search results sources
+        elif "search_results" in response.metadata:
+            search_results = response.metadata["search_results"]
+            for result in search_results.get_all_results()[:5]:  # Top 5
+                yield result.source
 
-        return unique_keywords[:10]  # Limit to 10
+        # Either of the above, kept from an earlier turn by _compact_metadata
+        elif "top_sources" in response.metadata:
+            yield from response.metadata["top_sources"]
 
-    def _extract_follow_up_questions(self, context: ConversationContext) -> list[str]:
-        """Extract follow-up questions from context."""
-        follow_ups = []
+    def _compact_metadata(self, context: ConversationContext) -> None:
+        """
+        Replace finished turns' search results and citation packages with summaries.
 
-        # Look for follow-up questions in agent responses
+        The full objects are only read within the turn that produced them, but
+        the context keeps every turn's responses. Later turns still read the
+        figures shown by get_conversation_analysis and the sources aggregated
+        into each answer, so those are kept (at most the 10 an answer uses).
+        """
         for response in context.agent_responses:
-            if response.clarification_options:
-                follow_ups.extend(response.clarification_options)
+            metadata = response.metadata
+            if "search_results" in metadata or "citation_package" in metadata:
+                metadata["top_sources"] = list(islice(self._iter_sources(response), 10))
 
-        # Default follow-ups based on intent
-        if context.extracted_intent:
-            intent = context.extracted_intent.lower()
-            if "법령" in intent:
-                follow_ups.extend([
-                    "어떤 법령이나 조항을 검토해야 할지 함께 살펴볼까요?",
-                    "관련 규제나 행정 해석이 필요한지도 알려주세요."
-                ])
-            elif "소송" in intent or "분쟁" in intent:
-                follow_ups.extend([
-                    "비슷한 분쟁 사례나 판례가 있는지 찾아드릴까요?",
-                    "진행 중인 절차나 일정이 있다면 공유해 주실 수 있을까요?"
-                ])
-
-        return follow_ups[:4]  # Limit to 4
+            search_results = metadata.pop("search_results", None)
+            if search_results is not None:
+                metadata["search_summary"] = {
+                    "total_results": search_results.total_count,
+                    "search_duration": search_results.search_duration
+                }
+
+            citation_package = metadata.pop("citation_package", None)
+            if citation_package is not None:
+                metadata["citation_summary"] = {
+                    "citations_count": len(citation_package.citations),
+                    "quality_score": citation_package.quality_score
+                }
 
     def _get_or_create_context(self, conversation_id: str) -> ConversationContext:
-        """Get existing conversation context or create new one."""
+        """Get existing conversation context or create and register a new one."""
         if conversation_id in self.conversations:
+            self.conversations.move_to_end(conversation_id)
             return self.conversations[conversation_id]
-        return ConversationContext(conversation_id=conversation_id)
+        # Registered up front so a turn that fails midway keeps its history
+        context = ConversationContext(conversation_id=conversation_id)
+        self._store_context(conversation_id, context)
+        return context
+
+    async def _load_context(self, conversation_id: str) -> ConversationContext:
+        """Get the context, preferring the shared store's copy when one is configured."""
+        if self.conversation_store is not None:
+            stored = await self.conversation_store.load(conversation_id)
+            if stored is not None:
+                self._store_context(conversation_id, stored)
+                return stored
+        return self._get_or_create_context(conversation_id)
+
+    def _store_context(self, conversation_id: str, context: ConversationContext) -> None:
+        """Store a context as most recently used, evicting the oldest past the cap."""
+        self.conversations[conversation_id] = context
+        self.conversations.move_to_end(conversation_id)
+        while len(self.conversations) > self.max_active_conversations:
+            self.conversations.popitem(last=False)
 
     async def get_pipeline_status(self) -> Dict[str, Any]:
         """Get overall enhanced pipeline status."""
@@ -622,16 +1075,16 @@ class EnhancedAgentPipeline:
 
     def get_conversation_status(self, conversation_id: str) -> Optional[Dict[str, Any]]:
         """Get status of a conversation."""
-        if conversation_id not in self.conversations:
+        context = self.conversations.get(conversation_id)
+        if context is None:
             return None
 
-        context = self.conversations[conversation_id]
-
         # Pipeline stage tracking
-        stages_completed = []
-        for response in context.agent_responses:
-            agent_name = getattr(response, 'agent_name', 'Unknown')
-            stages_completed.append(agent_name)
+        stages_completed = [
+            getattr(response, 'agent_name', 'Unknown')
+            for response in context.agent_responses
+        ]
+        last_response = context.agent_responses[-1] if context.agent_responses else None
 
         return {
             "conversation_id": conversation_id,
@@ -639,55 +1092,49 @@ class EnhancedAgentPipeline:
             "extracted_intent": context.extracted_intent,
             "extracted_keywords": context.extracted_keywords,
             "pipeline_stages_completed": stages_completed,
-            "last_agent_action": context.agent_responses[-1].action.value if context.agent_responses else None,
-            "final_confidence": context.agent_responses[-1].confidence if context.agent_responses else 0.0
+            "last_agent_action": last_response.action.value if last_response else None,
+            "final_confidence": last_response.confidence if last_response else 0.0
         }
 
     def clear_conversation(self, conversation_id: str) -> bool:
-        """Clear a conversation context."""
-        if conversation_id in self.conversations:
-            del self.conversations[conversation_id]
-            return True
-        return False
+        """
+        Clear a conversation context.
+
+        With a conversation store, the stored copy is deleted in the background
+        (so this must be called from the event loop); use aclear_conversation
+        to wait for it. Returns whether a local copy existed.
+        """
+        found = self.conversations.pop(conversation_id, None) is not None
+        if self.conversation_store is not None:
+            # Otherwise the next turn would load the cleared context back
+            task = asyncio.get_running_loop().create_task(
+                self.conversation_store.delete(conversation_id)
+            )
+            self._store_deletes.add(task)
+            task.add_done_callback(self._store_deletes.discard)
+        return found
+
+    async def aclear_conversation(self, conversation_id: str) -> bool:
+        """Clear a conversation context and wait until its stored copy is deleted."""
+        found = self.conversations.pop(conversation_id, None) is not None
+        if self.conversation_store is not None:
+            found = await self.conversation_store.delete(conversation_id) or found
+        return found
 
     def _generate_limit_exceeded_response(self, conversation_id: str) -> LegalResponse:
         """Generate response when conversation limit is exceeded."""
         return LegalResponse(
-            answer=f"""대화 횟수가 최대 {self.max_conversation_turns}회를 초과했습니다.
-
-새로운 질문을 원하시면 새 대화를 시작해 주세요.
-
-더 나은 답변을 위해 다음을 권장합니다:
-- 보다 구체적인 질문으로 새로 시작하기
-- 관련 법령명이나 조문을 포함한 질문하기
-- 개별 사안에 대해 직접 문의하기""",
-            sources=[],
+            answer=_LIMIT_EXCEEDED_TEMPLATE.format(max_turns=self.max_conversation_turns),
             confidence=0.0,
-            related_keywords=[],
-            follow_up_questions=[],
             query=None
         )
 
     def _generate_error_response(self, user_message: str, error: str) -> LegalResponse:
         """Generate error response."""
         return LegalResponse(
-            answer=f"""Sorry, an error occurred in the enhanced legal analysis process.
-
-Error: {error}
-
-Please try again:
-- Rephrase your question
-- Use simpler language
-- Try different keywords
-
-Contact administrator if problem persists.""",
-            sources=[],
+            answer=_ERROR_TEMPLATE.format(error=error),
             confidence=0.0,
-            related_keywords=[],
-            follow_up_questions=[
-                "Would you like to try a different approach?",
-                "Can you rephrase your question?"
-            ],
+            follow_up_questions=_ERROR_FOLLOW_UPS,
             query=None
         )
 
@@ -701,7 +1148,7 @@ class EnhancedConversationManager:
 
     async def start_conversation(self, initial_message: str) -> tuple[str, LegalResponse]:
         """Start a new conversation with enhanced analysis."""
-        conversation_id = str(uuid.uuid4())
+        conversation_id = uuid.uuid4().hex
         response = await self.pipeline.process_message(initial_message, conversation_id)
         return conversation_id, response
 
@@ -719,42 +1166,28 @@ class EnhancedConversationManager:
         if not status:
             return None
 
-        if conversation_id not in self.pipeline.conversations:
-            return None
-
         context = self.pipeline.conversations[conversation_id]
 
-        # Extract analysis results from agent responses
+        # Latest value per metadata key; scanning newest first stops as soon
+        # as every key has been seen
+        metadata_keys = ("analysis_result", "search_summary", "citation_summary", "validation_result")
+        latest: Dict[str, Any] = {}
+        for response in reversed(context.agent_responses):
+            for key in metadata_keys:
+                if key not in latest and key in response.metadata:
+                    latest[key] = response.metadata[key]
+            if len(latest) == len(metadata_keys):
+                break
+
+        # Search results and citation packages are compacted to summaries
+        # once a turn finishes (see EnhancedAgentPipeline._compact_metadata)
         analysis_data = {
-            "legal_analysis": None,
-            "search_quality": None,
-            "citation_quality": None,
-            "validation_results": None
+            "legal_analysis": latest.get("analysis_result"),
+            "search_quality": latest.get("search_summary"),
+            "citation_quality": latest.get("citation_summary"),
+            "validation_results": latest.get("validation_result")
         }
 
-        for response in context.agent_responses:
-            metadata = response.metadata or {}
-
-            if "analysis_result" in metadata:
-                analysis_data["legal_analysis"] = metadata["analysis_result"]
-
-            if "search_results" in metadata:
-                search_results = metadata["search_results"]
-                analysis_data["search_quality"] = {
-                    "total_results": search_results.total_count,
-                    "search_duration": search_results.search_duration
-                }
-
-            if "citation_package" in metadata:
-                citation_package = metadata["citation_package"]
-                analysis_data["citation_quality"] = {
-                    "citations_count": len(citation_package.citations),
-                    "quality_score": citation_package.quality_score
-                }
-
-            if "validation_result" in metadata:
-                analysis_data["validation_results"] = metadata["validation_result"]
-
         return {
             **status,
             "detailed_analysis": analysis_data,
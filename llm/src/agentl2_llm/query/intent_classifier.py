@@ -15,7 +15,7 @@ class IntentClassifier:
 
     def __init__(self):
         # Intent classification patterns
-        self.intent_patterns = {
+        intent_patterns = {
             QueryIntent.LAW_SEARCH: [
                 r"법령|법률|조문|시행령|시행규칙|규정",
                 r"어떤 법|무슨 법|관련 법령",
@@ -44,7 +44,7 @@ class IntentClassifier:
         }
 
         # Legal entity patterns
-        self.legal_entity_patterns = [
+        legal_entity_patterns = [
             r"개인정보보호법",
             r"정보통신망.*이용촉진.*정보보호.*법",
             r"신용정보.*이용.*보호.*법",
@@ -53,6 +53,17 @@ class IntentClassifier:
             r"민법|상법|형법|행정법",
         ]
 
+        # Compiled once here; classify() runs for every query
+        self.intent_patterns = {
+            intent: [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
+            for intent, patterns in intent_patterns.items()
+        }
+        self.legal_entity_patterns = [
+            re.compile(pattern, re.IGNORECASE) for pattern in legal_entity_patterns
+        ]
+        self._ws_re = re.compile(r'\s+')
+        self._hangul_re = re.compile(r'[가-힣]+')
+
     async def classify(self, query_text: str) -> LegalQuery:
         """Classify the intent of a legal query."""
         # Clean and normalize text
@@ -78,7 +89,7 @@ class IntentClassifier:
     def _normalize_text(self, text: str) -> str:
         """Normalize text for processing."""
         # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text.strip())
+        text = self._ws_re.sub(' ', text.strip())
         return text
 
     def _classify_intent(self, text: str) -> Tuple[QueryIntent, float]:
@@ -88,7 +99,7 @@ class IntentClassifier:
         for intent, patterns in self.intent_patterns.items():
             score = 0.0
             for pattern in patterns:
-                matches = len(re.findall(pattern, text, re.IGNORECASE))
+                matches = len(pattern.findall(text))
                 score += matches * 0.3  # Weight each match
             intent_scores[intent] = min(score, 1.0)
 
@@ -104,7 +115,7 @@ class IntentClassifier:
         """Extract legal entities from text."""
         entities = []
         for pattern in self.legal_entity_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
+            matches = pattern.findall(text)
             entities.extend(matches)
 
         return list(set(entities))  # Remove duplicates
@@ -119,7 +130,7 @@ class IntentClassifier:
         }
 
         # Split into words and filter
-        words = re.findall(r'[가-힣]+', text)
+        words = self._hangul_re.findall(text)
         keywords = [word for word in words if len(word) > 1 and word not in stopwords]
 
         # Deduplicate while preserving order
@@ -43,6 +43,47 @@ class KeywordExtractor:
             '때문', '위해', '통해', '대해', '관해', '따라', '의해'
         }
 
+        # Patterns are compiled once; extract() runs for every query
+        self._nonword_re = re.compile(r'[^\w\s가-힣]')
+        self._ws_re = re.compile(r'\s+')
+        self._hangul2_re = re.compile(r'[가-힣]{2,}')
+
+        # Compound terms (legal phrases)
+        self.compound_patterns = [re.compile(pattern) for pattern in (
+            r'[가-힣]+법',          # Laws ending with '법'
+            r'[가-힣]+령',          # Decrees ending with '령'
+            r'[가-힣]+규칙',        # Rules ending with '규칙'
+            r'[가-힣]+정보',        # Information terms
+            r'[가-힣]+보호',        # Protection terms
+            r'[가-힣]+의무',        # Obligation terms
+            r'[가-힣]+권리',        # Rights terms
+        )]
+
+        # Legal entity patterns
+        self.law_patterns = [re.compile(pattern) for pattern in (
+            r'[가-힣\s]*법(?:률)?',
+            r'[가-힣\s]*령',
+            r'[가-힣\s]*규칙',
+            r'[가-힣\s]*규정'
+        )]
+        self.court_patterns = [re.compile(pattern) for pattern in (
+            r'대법원',
+            r'[가-힣]*고등법원',
+            r'[가-힣]*지방법원',
+            r'[가-힣]*법원'
+        )]
+        self.case_number_pattern = re.compile(r'\d{4}[가-힣]\d+')
+        self.date_patterns = [re.compile(pattern) for pattern in (
+            r'\d{4}년\s*\d{1,2}월\s*\d{1,2}일',
+            r'\d{4}\.\d{1,2}\.\d{1,2}',
+            r'\d{4}-\d{1,2}-\d{1,2}'
+        )]
+        self.money_patterns = [re.compile(pattern) for pattern in (
+            r'\d+억\s*원',
+            r'\d+만\s*원',
+            r'\d+원'
+        )]
+
     async def extract(self, text: str) -> List[str]:
         """Extract keywords from text."""
         # Normalize text
@@ -60,10 +101,10 @@ class KeywordExtractor:
     def _normalize_text(self, text: str) -> str:
         """Normalize text for keyword extraction."""
         # Remove special characters except Korean, numbers, and spaces
-        text = re.sub(r'[^\w\s가-힣]', ' ', text)
+        text = self._nonword_re.sub(' ', text)
 
         # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text.strip())
+        text = self._ws_re.sub(' ', text.strip())
 
         return text
 
@@ -72,22 +113,12 @@ class KeywordExtractor:
         candidates = []
 
         # Extract single words (2+ characters)
-        words = re.findall(r'[가-힣]{2,}', text)
+        words = self._hangul2_re.findall(text)
         candidates.extend(words)
 
         # Extract compound terms (legal phrases)
-        compound_patterns = [
-            r'[가-힣]+법',          # Laws ending with '법'
-            r'[가-힣]+령',          # Decrees ending with '령'
-            r'[가-힣]+규칙',        # Rules ending with '규칙'
-            r'[가-힣]+정보',        # Information terms
-            r'[가-힣]+보호',        # Protection terms
-            r'[가-힣]+의무',        # Obligation terms
-            r'[가-힣]+권리',        # Rights terms
-        ]
-
-        for pattern in compound_patterns:
-            matches = re.findall(pattern, text)
+        for pattern in self.compound_patterns:
+            matches = pattern.findall(text)
             candidates.extend(matches)
 
         # Filter out stopwords
@@ -137,53 +168,26 @@ class KeywordExtractor:
         }
 
         # Law patterns
-        law_patterns = [
-            r'[가-힣\s]*법(?:률)?',
-            r'[가-힣\s]*령',
-            r'[가-힣\s]*규칙',
-            r'[가-힣\s]*규정'
-        ]
-
-        for pattern in law_patterns:
-            matches = re.findall(pattern, text)
+        for pattern in self.law_patterns:
+            matches = pattern.findall(text)
             entities['laws'].extend([match.strip() for match in matches if len(match.strip()) > 2])
 
         # Court patterns
-        court_patterns = [
-            r'대법원',
-            r'[가-힣]*고등법원',
-            r'[가-힣]*지방법원',
-            r'[가-힣]*법원'
-        ]
-
-        for pattern in court_patterns:
-            matches = re.findall(pattern, text)
+        for pattern in self.court_patterns:
+            matches = pattern.findall(text)
             entities['courts'].extend(matches)
 
         # Case number patterns
-        case_number_pattern = r'\d{4}[가-힣]\d+'
-        entities['case_numbers'] = re.findall(case_number_pattern, text)
+        entities['case_numbers'] = self.case_number_pattern.findall(text)
 
         # Date patterns
-        date_patterns = [
-            r'\d{4}년\s*\d{1,2}월\s*\d{1,2}일',
-            r'\d{4}\.\d{1,2}\.\d{1,2}',
-            r'\d{4}-\d{1,2}-\d{1,2}'
-        ]
-
-        for pattern in date_patterns:
-            matches = re.findall(pattern, text)
+        for pattern in self.date_patterns:
+            matches = pattern.findall(text)
             entities['dates'].extend(matches)
 
         # Monetary amount patterns
-        money_patterns = [
-            r'\d+억\s*원',
-            r'\d+만\s*원',
-            r'\d+원'
-        ]
-
-        for pattern in money_patterns:
-            matches = re.findall(pattern, text)
+        for pattern in self.money_patterns:
+            matches = pattern.findall(text)
             entities['monetary_amounts'].extend(matches)
 
         return entities
\ No newline at end of file
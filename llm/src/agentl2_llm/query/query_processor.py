@@ -4,6 +4,10 @@ Main query processing orchestrator.
 
 from __future__ import annotations
 
+import re
+from collections import OrderedDict
+from datetime import datetime
+
 from .intent_classifier import IntentClassifier
 from .keyword_extractor import KeywordExtractor
 from ..models import LegalQuery
@@ -12,12 +16,36 @@ from ..models import LegalQuery
 class QueryProcessor:
     """Orchestrates query analysis and processing."""
 
-    def __init__(self):
+    def __init__(self, cache_size: int = 4096):
         self.intent_classifier = IntentClassifier()
         self.keyword_extractor = KeywordExtractor()
+        # Analysis results keyed by whitespace-normalized query text (LRU)
+        self.cache_size = cache_size
+        self._cache: OrderedDict[str, LegalQuery] = OrderedDict()
 
     async def process(self, query_text: str) -> LegalQuery:
         """Process a legal query and return structured analysis."""
+        cache_key = re.sub(r'\s+', ' ', query_text.strip())
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            self._cache.move_to_end(cache_key)
+            # Callers may mutate the query, so hand out a copy
+            return cached.model_copy(
+                deep=True,
+                update={"original_text": query_text, "timestamp": datetime.now()}
+            )
+
+        legal_query = await self._analyze(query_text)
+
+        if self.cache_size > 0:
+            self._cache[cache_key] = legal_query.model_copy(deep=True)
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+        return legal_query
+
+    async def _analyze(self, query_text: str) -> LegalQuery:
+        """Run intent classification and keyword/entity extraction."""
         # Classify intent and extract basic keywords
         legal_query = await self.intent_classifier.classify(query_text)
 
@@ -36,4 +64,4 @@ class QueryProcessor:
         legal_query.keywords = enhanced_keywords
         legal_query.legal_entities = list(set(all_entities))  # Remove duplicates
 
-        return legal_query
\ No newline at end of file
+        return legal_query
@@ -34,6 +34,14 @@ class FactChecker:
             "court.go.kr": 0.9,
         }
 
+        # Content patterns that indicate ads or scraped login walls
+        self.suspicious_patterns = [re.compile(pattern, re.IGNORECASE) for pattern in (
+            r"click here",
+            r"광고",
+            r"스팸",
+            r"로그인.*필요",
+        )]
+
     async def verify(self, search_results: SearchResults) -> List[SearchResult]:
         """Verify and filter search results based on reliability."""
         verified_results = []
@@ -157,16 +165,9 @@ class FactChecker:
             issues.append("Highly repetitive content")
 
         # Check for suspicious patterns
-        suspicious_patterns = [
-            r"click here",
-            r"광고",
-            r"스팸",
-            r"로그인.*필요",
-        ]
-
-        for pattern in suspicious_patterns:
-            if re.search(pattern, result.content, re.IGNORECASE):
-                issues.append(f"Suspicious content pattern: {pattern}")
+        for pattern in self.suspicious_patterns:
+            if pattern.search(result.content):
+                issues.append(f"Suspicious content pattern: {pattern.pattern}")
 
         # Check for broken formatting
         if result.content.count('\n\n') > 10:
@@ -202,7 +203,17 @@ class ConsistencyChecker:
     """Checks for consistency across multiple search results."""
 
     def __init__(self):
-        pass
+        # Fact patterns, compiled once for every consistency check
+        self.date_patterns = [re.compile(pattern) for pattern in (
+            r'\d{4}년\s*\d{1,2}월\s*\d{1,2}일',
+            r'\d{4}\.\d{1,2}\.\d{1,2}',
+            r'\d{4}-\d{1,2}-\d{1,2}'
+        )]
+        self.legal_reference_pattern = re.compile(r'[가-힣\s]+법(?:률)?')
+        self.money_patterns = [re.compile(pattern) for pattern in (
+            r'\d+억\s*원', r'\d+만\s*원', r'\d+원'
+        )]
+        self.case_number_pattern = re.compile(r'\d{4}[가-힣]\d+')
 
     async def check_consistency(self, results: List[SearchResult]) -> Dict[str, any]:
         """Check for consistency across search results."""
@@ -243,27 +254,21 @@ class ConsistencyChecker:
             content = result.title + " " + result.content
 
             # Extract dates
-            date_patterns = [
-                r'\d{4}년\s*\d{1,2}월\s*\d{1,2}일',
-                r'\d{4}\.\d{1,2}\.\d{1,2}',
-                r'\d{4}-\d{1,2}-\d{1,2}'
-            ]
-            for pattern in date_patterns:
-                dates = re.findall(pattern, content)
+            for pattern in self.date_patterns:
+                dates = pattern.findall(content)
                 key_facts["dates"].extend(dates)
 
             # Extract legal references
-            legal_refs = re.findall(r'[가-힣\s]+법(?:률)?', content)
+            legal_refs = self.legal_reference_pattern.findall(content)
             key_facts["legal_references"].extend(legal_refs)
 
             # Extract monetary amounts
-            money_patterns = [r'\d+억\s*원', r'\d+만\s*원', r'\d+원']
-            for pattern in money_patterns:
-                amounts = re.findall(pattern, content)
+            for pattern in self.money_patterns:
+                amounts = pattern.findall(content)
                 key_facts["monetary_amounts"].extend(amounts)
 
             # Extract case numbers
-            case_numbers = re.findall(r'\d{4}[가-힣]\d+', content)
+            case_numbers = self.case_number_pattern.findall(content)
             key_facts["case_numbers"].extend(case_numbers)
 
         return key_facts
\ No newline at end of file
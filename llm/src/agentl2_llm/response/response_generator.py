@@ -6,7 +6,7 @@ from __future__ import annotations
 
 import json
 import time
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional, Tuple, Union
 
 import openai
 from loguru import logger
@@ -19,9 +19,19 @@ from .source_validator import SourceValidator, CitationManager
 class ResponseGenerator:
     """Generates responses to legal queries using LLM."""
 
-    def __init__(self, api_key: str, model: str = "gpt-4"):
-        self.client = openai.AsyncOpenAI(api_key=api_key)
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "gpt-4",
+        context_top_k: int = 5,
+        max_retries: int = 3,
+        client: Optional[openai.AsyncOpenAI] = None
+    ):
+        # The client retries rate limits, connection errors and 5xx with backoff
+        self.client = client or openai.AsyncOpenAI(api_key=api_key, max_retries=max_retries)
         self.model = model
+        # Number of search results quoted in the generation prompt
+        self.context_top_k = context_top_k
         self.fact_checker = FactChecker()
         self.consistency_checker = ConsistencyChecker()
         self.source_validator = SourceValidator()
@@ -50,23 +60,12 @@ class ResponseGenerator:
         max_tokens: int = 1000
     ) -> LegalResponse:
         """Generate a comprehensive legal response."""
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         try:
-            # Verify and validate information
-            # Convert search_results to SearchResults if it's a list
-            if isinstance(search_results, list):
-                from ..models import SearchResults
-                search_results_obj = SearchResults()
-                search_results_obj.external_results = search_results
-                search_results_obj.total_count = len(search_results)
-                verified_results = await self.fact_checker.verify(search_results_obj)
-            else:
-                verified_results = await self.fact_checker.verify(search_results)
-            validated_sources = await self.source_validator.validate_sources(verified_results)
-
-            # Check consistency
-            consistency_check = await self.consistency_checker.check_consistency(verified_results)
+            verified_results, validated_sources, consistency_check = await self._verify_results(
+                search_results
+            )
 
             # Generate response using LLM
             response_text = await self._generate_llm_response(
@@ -83,7 +82,7 @@ class ResponseGenerator:
                 confidence=self._calculate_overall_confidence(verified_results, consistency_check),
                 related_keywords=self._extract_related_keywords(verified_results),
                 follow_up_questions=follow_ups,
-                processing_time=time.time() - start_time,
+                processing_time=time.perf_counter() - start_time,
                 query=query
             )
 
@@ -94,6 +93,88 @@ class ResponseGenerator:
             logger.error(f"Error generating response: {e}")
             return self._generate_fallback_response(query, search_results)
 
+    async def generate_stream(
+        self,
+        query: LegalQuery,
+        search_results: List[SearchResult],
+        max_tokens: int = 1000
+    ) -> AsyncIterator[Union[str, LegalResponse]]:
+        """
+        Stream the answer text as the LLM produces it.
+
+        Yields text deltas, then the complete LegalResponse (sources, confidence,
+        follow-ups) once the stream has finished.
+        """
+        start_time = time.perf_counter()
+
+        try:
+            verified_results, validated_sources, consistency_check = await self._verify_results(
+                search_results
+            )
+        except Exception as e:
+            logger.error(f"Error generating response: {e}")
+            fallback = self._generate_fallback_response(query, search_results)
+            yield fallback.answer
+            yield fallback
+            return
+
+        parts: List[str] = []
+        try:
+            stream = await self.client.chat.completions.create(
+                model=self.model,
+                messages=self._build_messages(query, verified_results, consistency_check),
+                max_tokens=max_tokens,
+                temperature=0.3,
+                presence_penalty=0.1,
+                frequency_penalty=0.1,
+                stream=True
+            )
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    parts.append(delta)
+                    yield delta
+        except Exception as e:
+            logger.error(f"LLM API error: {e}")
+            # Nothing sent yet: the template answer stands in for the LLM one
+            if not parts:
+                template = self._generate_template_response(query, verified_results)
+                parts.append(template)
+                yield template
+
+        yield LegalResponse(
+            answer="".join(parts).strip(),
+            sources=validated_sources,
+            confidence=self._calculate_overall_confidence(verified_results, consistency_check),
+            related_keywords=self._extract_related_keywords(verified_results),
+            follow_up_questions=await self._generate_follow_up_questions(query, verified_results),
+            processing_time=time.perf_counter() - start_time,
+            query=query
+        )
+
+    async def _verify_results(
+        self,
+        search_results: List[SearchResult]
+    ) -> Tuple[List[SearchResult], List[SearchSource], dict]:
+        """Fact-check the results, validate their sources and check consistency."""
+        # Convert search_results to SearchResults if it's a list
+        if isinstance(search_results, list):
+            from ..models import SearchResults
+            search_results_obj = SearchResults()
+            search_results_obj.external_results = search_results
+            search_results_obj.total_count = len(search_results)
+            verified_results = await self.fact_checker.verify(search_results_obj)
+        else:
+            verified_results = await self.fact_checker.verify(search_results)
+        validated_sources = await self.source_validator.validate_sources(verified_results)
+
+        # Check consistency
+        consistency_check = await self.consistency_checker.check_consistency(verified_results)
+
+        return verified_results, validated_sources, consistency_check
+
     async def _generate_llm_response(
         self,
         query: LegalQuery,
@@ -102,6 +183,29 @@ class ResponseGenerator:
         max_tokens: int
     ) -> str:
         """Generate response using LLM."""
+        try:
+            response = await self.client.chat.completions.create(
+                model=self.model,
+                messages=self._build_messages(query, results, consistency_check),
+                max_tokens=max_tokens,
+                temperature=0.3,  # Lower temperature for more consistent legal advice
+                presence_penalty=0.1,
+                frequency_penalty=0.1
+            )
+
+            return response.choices[0].message.content.strip()
+
+        except Exception as e:
+            logger.error(f"LLM API error: {e}")
+            return self._generate_template_response(query, results)
+
+    def _build_messages(
+        self,
+        query: LegalQuery,
+        results: List[SearchResult],
+        consistency_check: dict
+    ) -> List[dict]:
+        """Build the chat messages for answer generation."""
 
         # Prepare context from search results
         context = self._prepare_context(results)
@@ -124,33 +228,26 @@ class ResponseGenerator:
 
 위 정보를 바탕으로 질문에 대한 정확하고 유용한 답변을 제공해 주세요."""
 
-        try:
-            response = await self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": self.system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
-                max_tokens=max_tokens,
-                temperature=0.3,  # Lower temperature for more consistent legal advice
-                presence_penalty=0.1,
-                frequency_penalty=0.1
-            )
-
-            return response.choices[0].message.content.strip()
-
-        except Exception as e:
-            logger.error(f"LLM API error: {e}")
-            return self._generate_template_response(query, results)
+        return [
+            {"role": "system", "content": self.system_prompt},
+            {"role": "user", "content": user_prompt}
+        ]
 
     def _prepare_context(self, results: List[SearchResult]) -> str:
         """Prepare context from search results for LLM."""
         if not results:
             return "관련 정보를 찾을 수 없습니다."
 
+        # Most relevant results first; the URL tie-break keeps the prompt identical
+        # for identical result sets regardless of search order
+        top_results = sorted(
+            results,
+            key=lambda result: (-result.relevance_score, result.source.url)
+        )[:self.context_top_k]
+
         context_parts = []
 
-        for i, result in enumerate(results[:5], 1):  # Limit to top 5 results
+        for i, result in enumerate(top_results, 1):
             context_part = f"""
 {i}. {result.title}
 출처: {result.source.url}
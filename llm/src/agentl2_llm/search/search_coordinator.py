@@ -34,7 +34,7 @@ class SearchCoordinator:
         limit: int = 20
     ) -> SearchResults:
         """Coordinate search across all available sources."""
-        start_time = time.time()
+        start_time = time.perf_counter()
         results = SearchResults()
 
         logger.info(f"Starting search for keywords: {keywords}, intent: {intent}")
@@ -58,7 +58,7 @@ class SearchCoordinator:
             logger.error(f"Error during search coordination: {e}")
 
         # Calculate search duration
-        results.search_duration = time.time() - start_time
+        results.search_duration = time.perf_counter() - start_time
 
         logger.info(f"Search completed in {results.search_duration:.2f}s, total results: {results.total_count}")
         return results
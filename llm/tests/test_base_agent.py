@@ -247,6 +247,43 @@ class TestBaseAgent:
 
         assert "API Error" in str(exc_info.value)
 
+    @pytest.mark.asyncio
+    async def test_call_llm_respects_semaphore(self, mock_openai_client):
+        """Test that a shared semaphore caps concurrent LLM calls."""
+        import asyncio
+
+        class TestAgent(BaseAgent):
+            def _get_system_prompt(self) -> str:
+                return "Test prompt"
+
+            async def process(self, user_input: str, context: ConversationContext) -> AgentResponse:
+                return AgentResponse(action=AgentAction.COMPLETE)
+
+        completion = mock_openai_client.chat.completions.create.return_value
+        in_flight = 0
+        peak = 0
+
+        async def create(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return completion
+
+        mock_openai_client.chat.completions.create = AsyncMock(side_effect=create)
+        agent = TestAgent(
+            name="Test",
+            openai_client=mock_openai_client,
+            llm_semaphore=asyncio.Semaphore(2)
+        )
+
+        messages = [{"role": "user", "content": "Test"}]
+        await asyncio.gather(*(agent._call_llm(messages) for _ in range(5)))
+
+        assert peak == 2
+        assert mock_openai_client.chat.completions.create.call_count == 5
+
     def test_build_conversation_history_empty(
         self,
         mock_openai_client,
@@ -298,6 +335,30 @@ class TestBaseAgent:
         assert any(msg["role"] == "user" for msg in messages)
         assert any(msg["role"] == "assistant" for msg in messages)
 
+    def test_build_conversation_history_context_summary_is_trailing(
+        self,
+        mock_openai_client,
+        sample_context_with_history
+    ):
+        """Test that the per-turn context summary follows the stable history."""
+        class TestAgent(BaseAgent):
+            def _get_system_prompt(self) -> str:
+                return "Test system prompt"
+
+            async def process(self, user_input: str, context: ConversationContext) -> AgentResponse:
+                return AgentResponse(action=AgentAction.COMPLETE)
+
+        agent = TestAgent(
+            name="Test",
+            openai_client=mock_openai_client
+        )
+
+        messages = agent._build_conversation_history(sample_context_with_history)
+
+        assert messages[1] == {"role": "user", "content": "개인정보 처리에 대해 궁금합니다"}
+        assert messages[-1]["role"] == "system"
+        assert "개인정보 처리 문의" in messages[-1]["content"]
+
     def test_agent_initialization(self, mock_openai_client):
         """Test agent initialization with custom parameters."""
         class TestAgent(BaseAgent):
@@ -319,3 +380,26 @@ class TestBaseAgent:
         assert agent.temperature == 0.7
         assert agent.client == mock_openai_client
         assert agent.system_prompt == "Custom system prompt"
+
+    def test_system_prompt_override(self, mock_openai_client):
+        """Test that an injected system prompt replaces the built-in one."""
+        class TestAgent(BaseAgent):
+            def _get_system_prompt(self) -> str:
+                return "Built-in prompt"
+
+            async def process(self, user_input: str, context: ConversationContext) -> AgentResponse:
+                return AgentResponse(action=AgentAction.COMPLETE)
+
+        agent = TestAgent(
+            name="Test",
+            openai_client=mock_openai_client,
+            system_prompt="Injected prompt"
+        )
+
+        messages = agent._build_messages("질문")
+
+        assert agent.system_prompt == "Injected prompt"
+        assert messages == [
+            {"role": "system", "content": "Injected prompt"},
+            {"role": "user", "content": "질문"}
+        ]
@@ -0,0 +1,124 @@
+"""Tests for conversation context stores."""
+
+import asyncio
+
+import pytest
+from unittest.mock import patch
+
+from agentl2_llm.agents.base_agent import AgentAction, AgentResponse, ConversationContext
+from agentl2_llm.pipeline.conversation_store import RedisConversationStore
+from agentl2_llm.pipeline.enhanced_agent_pipeline import EnhancedAgentPipeline
+
+
+class FakeRedis:
+    """Minimal in-memory stand-in for the redis.asyncio client API used."""
+
+    def __init__(self):
+        self.data = {}
+        self.expiry = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.data[key] = value
+        self.expiry[key] = ex
+
+    async def delete(self, key):
+        return 1 if self.data.pop(key, None) is not None else 0
+
+
+class TestRedisConversationStore:
+    """Test suite for RedisConversationStore."""
+
+    @pytest.mark.asyncio
+    async def test_round_trip_drops_response_metadata(self):
+        """Contexts survive a save/load round trip without per-turn metadata."""
+        client = FakeRedis()
+        store = RedisConversationStore(client, ttl=60)
+        context = ConversationContext(
+            conversation_id="conv-1",
+            user_messages=["개인정보 수집 동의"],
+            agent_responses=[
+                AgentResponse(
+                    action=AgentAction.FORWARD_TO_SEARCH,
+                    message="검색합니다",
+                    metadata={"search_results": object()}
+                )
+            ],
+            extracted_intent="개인정보 문의",
+            extracted_keywords=["개인정보", "동의"],
+            session_metadata={"priority_memory": {"intents": ["개인정보 문의"], "keywords": ["동의"]}}
+        )
+
+        await store.save(context)
+        loaded = await store.load("conv-1")
+
+        assert client.expiry["agentl2:conversation:conv-1"] == 60
+        assert loaded.user_messages == context.user_messages
+        assert loaded.extracted_keywords == ["개인정보", "동의"]
+        assert loaded.session_metadata == context.session_metadata
+        assert loaded.agent_responses[0].message == "검색합니다"
+        assert loaded.agent_responses[0].metadata == {}
+
+    @pytest.mark.asyncio
+    async def test_load_and_delete_missing(self):
+        """Unknown conversations load as None and delete reports False."""
+        store = RedisConversationStore(FakeRedis())
+
+        assert await store.load("missing") is None
+        assert await store.delete("missing") is False
+
+    @pytest.mark.asyncio
+    async def test_pipeline_continues_conversation_from_store(self, mock_openai_client):
+        """A pipeline picks up a conversation saved by another worker."""
+        store = RedisConversationStore(FakeRedis())
+        await store.save(ConversationContext(
+            conversation_id="shared",
+            user_messages=["첫 번째 질문"]
+        ))
+
+        with patch('agentl2_llm.pipeline.enhanced_agent_pipeline.openai.AsyncOpenAI', return_value=mock_openai_client):
+            pipeline = EnhancedAgentPipeline(
+                openai_api_key="test-key",
+                conversation_store=store
+            )
+
+        with patch.object(pipeline.facilitator, 'process') as mock_facilitator:
+            mock_facilitator.return_value = AgentResponse(
+                action=AgentAction.REQUEST_CLARIFICATION,
+                message="추가 정보가 필요합니다",
+                confidence=0.5
+            )
+
+            await pipeline.process_message("두 번째 질문", conversation_id="shared")
+
+        stored = await store.load("shared")
+        assert stored.user_messages == ["첫 번째 질문", "두 번째 질문"]
+
+    @pytest.mark.asyncio
+    async def test_pipeline_clear_removes_stored_conversation(self, mock_openai_client):
+        """Clearing a conversation also deletes it from the store."""
+        store = RedisConversationStore(FakeRedis())
+
+        with patch('agentl2_llm.pipeline.enhanced_agent_pipeline.openai.AsyncOpenAI', return_value=mock_openai_client):
+            pipeline = EnhancedAgentPipeline(
+                openai_api_key="test-key",
+                conversation_store=store
+            )
+
+        # Saved by another worker, so this pipeline has no local copy
+        await store.save(ConversationContext(
+            conversation_id="shared",
+            user_messages=["첫 번째 질문"]
+        ))
+
+        assert await pipeline.aclear_conversation("shared") is True
+        assert await store.load("shared") is None
+        assert await pipeline.aclear_conversation("shared") is False
+
+        # The sync variant deletes the stored copy in the background
+        await store.save(ConversationContext(conversation_id="shared"))
+        assert pipeline.clear_conversation("shared") is False
+        await asyncio.gather(*pipeline._store_deletes)
+        assert await store.load("shared") is None
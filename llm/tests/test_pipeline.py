@@ -136,6 +136,30 @@ class TestEnhancedAgentPipeline:
             assert "추가 정보" in response.answer or "필요" in response.answer
             assert len(response.follow_up_questions) > 0
 
+    @pytest.mark.asyncio
+    async def test_process_message_stream_yields_final_response_last(self, pipeline):
+        """Test that the stream yields step events and ends with the final response."""
+        with patch.object(pipeline.facilitator, 'process') as mock_facilitator:
+            from agentl2_llm.agents.base_agent import AgentResponse
+
+            mock_facilitator.return_value = AgentResponse(
+                action=AgentAction.REQUEST_CLARIFICATION,
+                message="추가 정보가 필요합니다",
+                clarification_options=["어떤 종류의 개인정보인가요?"],
+                confidence=0.5
+            )
+
+            events = [
+                event async for event in pipeline.process_message_stream("개인정보에 대해 궁금합니다")
+            ]
+
+            assert [event.agent for event in events] == ["facilitator", "pipeline", "pipeline"]
+            assert events[1].payload["stage"] == "clarification_needed"
+            assert all(event.response is None for event in events[:-1])
+            assert events[-1].payload["stage"] == "completed"
+            assert events[-1].response.answer == "추가 정보가 필요합니다"
+            assert "timestamp" in events[-1].payload
+
     @pytest.mark.asyncio
     async def test_process_message_with_conversation_id(self, pipeline):
         """Test processing with existing conversation ID."""
@@ -243,6 +267,11 @@ class TestEnhancedAgentPipeline:
                     # Should get limit exceeded response
                     assert "대화 횟수" in response.answer or "최대" in response.answer
 
+            # Further rejected messages are not kept in the history
+            await pipeline.process_message("추가 질문", conversation_id=conversation_id)
+            context = pipeline.conversations[conversation_id]
+            assert len(context.user_messages) == pipeline.max_conversation_turns
+
     @pytest.mark.asyncio
     async def test_event_handler_called(self, pipeline):
         """Test event handler is called for each agent step."""
@@ -287,6 +316,387 @@ class TestEnhancedAgentPipeline:
             agent_names = [event["agent"] for event in events_received]
             assert "facilitator" in agent_names
 
+    @pytest.mark.asyncio
+    async def test_analyst_and_response_run_concurrently(self, pipeline):
+        """Analyst and response agents overlap but are recorded in pipeline order."""
+        import asyncio
+        from agentl2_llm.agents.base_agent import AgentResponse
+
+        response_started = asyncio.Event()
+
+        async def analyst_process(user_input, context):
+            # Only completes once the response agent is already running
+            await asyncio.wait_for(response_started.wait(), timeout=1)
+            return AgentResponse(
+                action=AgentAction.FORWARD_TO_RESPONSE,
+                message="분석 완료",
+                confidence=0.8
+            )
+
+        async def response_process(user_input, context):
+            response_started.set()
+            return AgentResponse(
+                action=AgentAction.FORWARD_TO_RESPONSE,
+                message="답변 초안",
+                confidence=0.8
+            )
+
+        with patch.object(pipeline.facilitator, 'process') as mock_facilitator, \
+             patch.object(pipeline.search_agent, 'process') as mock_search, \
+             patch.object(pipeline.analyst, 'process', side_effect=analyst_process), \
+             patch.object(pipeline.response_agent, 'process', side_effect=response_process), \
+             patch.object(pipeline.citation_agent, 'process') as mock_citation, \
+             patch.object(pipeline.validator, 'process') as mock_validator:
+
+            mock_facilitator.return_value = AgentResponse(
+                action=AgentAction.FORWARD_TO_SEARCH,
+                confidence=0.9
+            )
+            mock_search.return_value = AgentResponse(
+                action=AgentAction.FORWARD_TO_RESPONSE,
+                confidence=0.85,
+                metadata={"search_results": MagicMock(total_count=1)}
+            )
+            mock_citation.return_value = AgentResponse(
+                action=AgentAction.FORWARD_TO_RESPONSE,
+                confidence=0.8
+            )
+            mock_validator.return_value = AgentResponse(
+                action=AgentAction.COMPLETE,
+                message="최종 답변",
+                confidence=0.9
+            )
+
+            response = await pipeline.process_message("테스트 질문", conversation_id="parallel")
+
+            assert response.answer == "최종 답변"
+            messages = [r.message for r in pipeline.conversations["parallel"].agent_responses]
+            assert messages.index("분석 완료") < messages.index("답변 초안")
+
+    @pytest.mark.asyncio
+    async def test_speculative_search_cancelled_on_clarification(self, pipeline):
+        """A speculative search is dropped when the facilitator asks for clarification."""
+        import asyncio
+        from agentl2_llm.agents.base_agent import AgentResponse
+
+        search_started = asyncio.Event()
+        search_cancelled = asyncio.Event()
+
+        async def facilitator_process(user_input, context):
+            # Only answers once the search is already running
+            await asyncio.wait_for(search_started.wait(), timeout=1)
+            return AgentResponse(
+                action=AgentAction.REQUEST_CLARIFICATION,
+                message="추가 정보가 필요합니다",
+                confidence=0.5
+            )
+
+        async def slow_search(user_input, context):
+            search_started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                search_cancelled.set()
+                raise
+
+        pipeline.speculative_search = True
+        with patch.object(pipeline.facilitator, 'process', side_effect=facilitator_process), \
+             patch.object(pipeline.search_agent, 'process', side_effect=slow_search):
+
+            response = await pipeline.process_message("개인정보에 대해 궁금합니다")
+
+            assert response.answer == "추가 정보가 필요합니다"
+            assert search_cancelled.is_set()
+
+    @pytest.mark.asyncio
+    async def test_high_confidence_answer_skips_review(self, pipeline):
+        """Citation and validation are skipped above the review threshold."""
+        from agentl2_llm.agents.base_agent import AgentResponse
+
+        pipeline.review_confidence_threshold = 0.9
+        with patch.object(pipeline.facilitator, 'process') as mock_facilitator, \
+             patch.object(pipeline.search_agent, 'process') as mock_search, \
+             patch.object(pipeline.analyst, 'process') as mock_analyst, \
+             patch.object(pipeline.response_agent, 'process') as mock_response, \
+             patch.object(pipeline.citation_agent, 'process') as mock_citation, \
+             patch.object(pipeline.validator, 'process') as mock_validator:
+
+            mock_facilitator.return_value = AgentResponse(
+                action=AgentAction.FORWARD_TO_SEARCH,
+                confidence=0.9
+            )
+            mock_search.return_value = AgentResponse(action=AgentAction.FORWARD_TO_RESPONSE)
+            mock_analyst.return_value = AgentResponse(action=AgentAction.FORWARD_TO_RESPONSE)
+            mock_response.return_value = AgentResponse(
+                action=AgentAction.COMPLETE,
+                message="확실한 답변",
+                confidence=0.95,
+                metadata={"sources": ["개인정보보호법 제15조"]}
+            )
+
+            response = await pipeline.process_message("개인정보 수집 동의가 필요한가요?")
+
+            assert response.answer == "확실한 답변"
+            assert response.confidence == 0.95
+            mock_citation.assert_not_called()
+            mock_validator.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_high_confidence_answer_with_references_is_cited(self, pipeline):
+        """Unresolved [REF-] markers still go through citation; only validation is skipped."""
+        from agentl2_llm.agents.base_agent import AgentResponse
+        from agentl2_llm.agents.citation_agent import CitationPackage
+
+        pipeline.review_confidence_threshold = 0.9
+        with patch.object(pipeline.facilitator, 'process') as mock_facilitator, \
+             patch.object(pipeline.search_agent, 'process') as mock_search, \
+             patch.object(pipeline.analyst, 'process') as mock_analyst, \
+             patch.object(pipeline.response_agent, 'process') as mock_response, \
+             patch.object(pipeline.citation_agent, 'process') as mock_citation, \
+             patch.object(pipeline.validator, 'process') as mock_validator:
+
+            mock_facilitator.return_value = AgentResponse(
+                action=AgentAction.FORWARD_TO_SEARCH,
+                confidence=0.9
+            )
+            mock_search.return_value = AgentResponse(action=AgentAction.FORWARD_TO_RESPONSE)
+            mock_analyst.return_value = AgentResponse(action=AgentAction.FORWARD_TO_RESPONSE)
+            mock_response.return_value = AgentResponse(
+                action=AgentAction.COMPLETE,
+                message="동의가 필요합니다 [REF-001]",
+                confidence=0.95,
+                metadata={"sources": ["개인정보보호법 제15조"]}
+            )
+            mock_citation.return_value = AgentResponse(
+                action=AgentAction.FORWARD_TO_RESPONSE,
+                confidence=0.8,
+                metadata={"citation_package": CitationPackage(
+                    citations=[],
+                    formatted_citations="[REF-001] 개인정보보호법 제15조",
+                    source_list=[],
+                    reference_map={},
+                    quality_score=0.8
+                )}
+            )
+
+            response = await pipeline.process_message("개인정보 수집 동의가 필요한가요?")
+
+            mock_citation.assert_called_once()
+            mock_validator.assert_not_called()
+            assert response.answer.startswith("동의가 필요합니다 [REF-001]")
+            assert response.answer.endswith("[REF-001] 개인정보보호법 제15조")
+            assert response.confidence == 0.95
+
+    @pytest.mark.asyncio
+    async def test_identical_concurrent_messages_share_one_run(self, pipeline):
+        """A duplicate message sent while the first is in flight reuses its run."""
+        import asyncio
+        from agentl2_llm.agents.base_agent import AgentResponse
+
+        async def facilitator_process(user_input, context):
+            await asyncio.sleep(0.01)
+            return AgentResponse(
+                action=AgentAction.REQUEST_CLARIFICATION,
+                message="추가 정보가 필요합니다",
+                confidence=0.5
+            )
+
+        with patch.object(pipeline.facilitator, 'process', side_effect=facilitator_process) as mock_facilitator:
+            first, second = await asyncio.gather(
+                pipeline.process_message("개인정보 문의", conversation_id="dup-conv"),
+                pipeline.process_message("  개인정보   문의 ", conversation_id="dup-conv")
+            )
+
+            assert mock_facilitator.call_count == 1
+            assert first.answer == second.answer == "추가 정보가 필요합니다"
+            assert first is not second
+            assert len(pipeline.conversations["dup-conv"].user_messages) == 1
+
+    @pytest.mark.asyncio
+    async def test_stage_timeout_opens_circuit(self, pipeline):
+        """Timed-out stages fall back, and repeated timeouts skip the agent."""
+        import asyncio
+
+        calls = 0
+
+        async def slow_facilitator(user_input, context):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(10)
+
+        pipeline.stage_timeouts = {"facilitator": 0.01}
+        pipeline.breaker_threshold = 2
+        with patch.object(pipeline.facilitator, 'process', side_effect=slow_facilitator):
+            for i in range(3):
+                response = await pipeline.process_message(f"질문 {i}")
+                assert "오류가 발생했습니다" in response.answer
+
+            # The third message hit the open circuit without calling the agent
+            assert calls == 2
+
+    @pytest.mark.asyncio
+    async def test_facilitator_cache_reuses_opening_message(self, pipeline):
+        """A repeated opening message reuses the cached facilitator result."""
+        from agentl2_llm.agents.base_agent import AgentResponse
+
+        pipeline.facilitator_cache_size = 8
+        with patch.object(pipeline.facilitator, 'process') as mock_facilitator:
+            mock_facilitator.return_value = AgentResponse(
+                action=AgentAction.REQUEST_CLARIFICATION,
+                message="추가 정보가 필요합니다",
+                intent="개인정보 문의",
+                confidence=0.6
+            )
+
+            await pipeline.process_message("개인정보 문의", conversation_id="cache-1")
+            response = await pipeline.process_message("개인정보  문의", conversation_id="cache-2")
+            # Follow-up turns have history and always reach the facilitator
+            await pipeline.process_message("개인정보 문의", conversation_id="cache-1")
+
+            assert response.answer == "추가 정보가 필요합니다"
+            assert mock_facilitator.call_count == 2
+            assert pipeline.conversations["cache-2"].extracted_intent == "개인정보 문의"
+
+    @pytest.mark.asyncio
+    async def test_step_payloads_skipped_without_event_handler(self, pipeline):
+        """Without an event handler no per-agent step payloads are built."""
+        from agentl2_llm.agents.base_agent import AgentResponse
+
+        with patch.object(pipeline.facilitator, 'process') as mock_facilitator, \
+             patch.object(pipeline.search_agent, 'process') as mock_search, \
+             patch.object(pipeline.analyst, 'process') as mock_analyst, \
+             patch.object(pipeline.response_agent, 'process') as mock_response, \
+             patch.object(pipeline.citation_agent, 'process') as mock_citation, \
+             patch.object(pipeline.validator, 'process') as mock_validator, \
+             patch.object(pipeline, '_agent_step_event') as mock_step_event:
+
+            mock_facilitator.return_value = AgentResponse(
+                action=AgentAction.FORWARD_TO_SEARCH,
+                confidence=0.9
+            )
+            mock_search.return_value = AgentResponse(action=AgentAction.FORWARD_TO_RESPONSE)
+            mock_analyst.return_value = AgentResponse(action=AgentAction.FORWARD_TO_RESPONSE)
+            mock_response.return_value = AgentResponse(action=AgentAction.FORWARD_TO_RESPONSE)
+            mock_citation.return_value = AgentResponse(action=AgentAction.FORWARD_TO_RESPONSE)
+            mock_validator.return_value = AgentResponse(
+                action=AgentAction.COMPLETE,
+                message="최종 답변",
+                confidence=0.9
+            )
+
+            response = await pipeline.process_message("테스트 질문")
+
+            assert response.answer == "최종 답변"
+            mock_step_event.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_compacted_turns_keep_sources_and_summaries(self, pipeline):
+        """Earlier turns' sources and search figures survive metadata compaction."""
+        from agentl2_llm.agents.base_agent import AgentResponse
+        from agentl2_llm.models import SearchResult, SearchResults
+        from agentl2_llm.pipeline.enhanced_agent_pipeline import EnhancedConversationManager
+
+        source = SearchSource(
+            url="https://law.go.kr/개인정보보호법",
+            title="개인정보보호법",
+            source_type=SourceType.INTERNAL_LAW,
+            confidence=0.9
+        )
+        search_results = SearchResults(search_duration=0.2)
+        search_results.add_internal([
+            SearchResult(title="개인정보보호법", content="제15조", source=source, relevance_score=0.9)
+        ])
+
+        with patch.object(pipeline.facilitator, 'process') as mock_facilitator, \
+             patch.object(pipeline.search_agent, 'process') as mock_search, \
+             patch.object(pipeline.analyst, 'process') as mock_analyst, \
+             patch.object(pipeline.response_agent, 'process') as mock_response, \
+             patch.object(pipeline.citation_agent, 'process') as mock_citation, \
+             patch.object(pipeline.validator, 'process') as mock_validator:
+
+            mock_facilitator.return_value = AgentResponse(
+                action=AgentAction.FORWARD_TO_SEARCH,
+                confidence=0.9
+            )
+            mock_search.side_effect = [
+                AgentResponse(
+                    action=AgentAction.FORWARD_TO_RESPONSE,
+                    metadata={"search_results": search_results}
+                ),
+                AgentResponse(action=AgentAction.FORWARD_TO_RESPONSE)
+            ]
+            mock_analyst.return_value = AgentResponse(action=AgentAction.FORWARD_TO_RESPONSE)
+            mock_response.return_value = AgentResponse(action=AgentAction.FORWARD_TO_RESPONSE)
+            mock_citation.return_value = AgentResponse(action=AgentAction.FORWARD_TO_RESPONSE)
+            mock_validator.return_value = AgentResponse(
+                action=AgentAction.COMPLETE,
+                message="최종 답변",
+                confidence=0.9
+            )
+
+            await pipeline.process_message("첫 번째 질문", conversation_id="compact")
+            response = await pipeline.process_message("두 번째 질문", conversation_id="compact")
+
+        assert [s.url for s in response.sources] == [source.url]
+
+        first_search = pipeline.conversations["compact"].agent_responses[1].metadata
+        assert "search_results" not in first_search
+        assert first_search["top_sources"] == [source]
+
+        analysis = EnhancedConversationManager(pipeline).get_conversation_analysis("compact")
+        assert analysis["detailed_analysis"]["search_quality"] == {
+            "total_results": 1,
+            "search_duration": 0.2
+        }
+
+    @pytest.mark.asyncio
+    async def test_closing_stream_cancels_inflight_agents(self, pipeline):
+        """Closing the event stream early cancels agent calls still running."""
+        import asyncio
+        from agentl2_llm.agents.base_agent import AgentResponse
+
+        response_started = asyncio.Event()
+        response_cancelled = asyncio.Event()
+
+        async def analyst_process(user_input, context):
+            await response_started.wait()
+            return AgentResponse(
+                action=AgentAction.FORWARD_TO_RESPONSE,
+                message="분석 완료",
+                confidence=0.8
+            )
+
+        async def slow_response(user_input, context):
+            response_started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                response_cancelled.set()
+                raise
+
+        with patch.object(pipeline.facilitator, 'process') as mock_facilitator, \
+             patch.object(pipeline.search_agent, 'process') as mock_search, \
+             patch.object(pipeline.analyst, 'process', side_effect=analyst_process), \
+             patch.object(pipeline.response_agent, 'process', side_effect=slow_response):
+
+            mock_facilitator.return_value = AgentResponse(
+                action=AgentAction.FORWARD_TO_SEARCH,
+                confidence=0.9
+            )
+            mock_search.return_value = AgentResponse(
+                action=AgentAction.FORWARD_TO_RESPONSE,
+                confidence=0.85,
+                metadata={"search_results": MagicMock(total_count=1)}
+            )
+
+            stream = pipeline.process_message_stream("테스트 질문")
+            async for event in stream:
+                if event.agent == "analyst":
+                    break
+            await stream.aclose()
+
+            assert response_cancelled.is_set()
+
     @pytest.mark.asyncio
     async def test_priority_memory_updates_multi_turn(self, pipeline):
         """Latest intent/keywords should be prioritised across turns."""
@@ -355,7 +765,7 @@ class TestEnhancedAgentPipeline:
             assert context.extracted_intent == "두 번째 의도"
             assert context.extracted_keywords[0] == "새 키워드"
 
-@pytest.mark.asyncio
+    @pytest.mark.asyncio
     async def test_error_handling(self, pipeline):
         """Test error handling in pipeline."""
         with patch.object(pipeline.facilitator, 'process') as mock_facilitator:
@@ -438,6 +848,20 @@ class TestEnhancedAgentPipeline:
         result = pipeline.clear_conversation("non-existent-id")
         assert result is False
 
+    def test_conversations_evict_least_recently_used(self, pipeline):
+        """Test that the conversation store stays bounded."""
+        from agentl2_llm.agents.base_agent import ConversationContext
+
+        pipeline.max_active_conversations = 2
+        for conversation_id in ("a", "b"):
+            pipeline._store_context(conversation_id, ConversationContext(conversation_id=conversation_id))
+
+        # Touching "a" makes "b" the eviction candidate
+        pipeline._get_or_create_context("a")
+        pipeline._store_context("c", ConversationContext(conversation_id="c"))
+
+        assert list(pipeline.conversations) == ["a", "c"]
+
     @pytest.mark.asyncio
     async def test_close(self, pipeline):
         """Test pipeline cleanup."""
@@ -0,0 +1,143 @@
+"""Tests for the response caches."""
+
+import asyncio
+import time
+
+import pytest
+
+from agentl2_llm.cache import CachedResponse, EmbeddingBatcher, ResponseCache, SemanticCache
+from agentl2_llm.models import LegalResponse
+
+
+def _entry(answer: str) -> CachedResponse:
+    response = LegalResponse(answer=answer, sources=[], confidence=0.8)
+    return CachedResponse(response=response, payload={"answer": answer}, content_frames=[b"x"])
+
+
+class TestResponseCache:
+    """Test suite for ResponseCache."""
+
+    def test_key_normalizes_message(self):
+        """Keys ignore surrounding whitespace and case but not the conversation."""
+        key = ResponseCache.make_key("conv-1", "  Hello ")
+        assert key == ResponseCache.make_key("conv-1", "hello")
+        assert key != ResponseCache.make_key("conv-2", "hello")
+        assert key != ResponseCache.make_key(None, "hello")
+        assert len(key) == 16
+
+    def test_get_and_set(self):
+        """Stored entries are returned until evicted."""
+        cache = ResponseCache(maxsize=2, ttl=60)
+        cache.set(b"a", _entry("A"))
+
+        assert cache.get(b"a").payload == {"answer": "A"}
+        assert cache.get(b"missing") is None
+
+    def test_lru_eviction(self):
+        """The least recently used entry is evicted first."""
+        cache = ResponseCache(maxsize=2, ttl=60)
+        cache.set(b"a", _entry("A"))
+        cache.set(b"b", _entry("B"))
+        cache.get(b"a")
+        cache.set(b"c", _entry("C"))
+
+        assert len(cache) == 2
+        assert cache.get(b"b") is None
+        assert cache.get(b"a") is not None
+        assert cache.get(b"c") is not None
+
+    def test_ttl_expiry(self):
+        """Expired entries are dropped on access."""
+        cache = ResponseCache(maxsize=2, ttl=0.01)
+        cache.set(b"a", _entry("A"))
+        time.sleep(0.02)
+
+        assert cache.get(b"a") is None
+        assert len(cache) == 0
+
+
+class TestSemanticCache:
+    """Test suite for SemanticCache."""
+
+    @staticmethod
+    def _embedder(vectors):
+        async def embed(text):
+            return vectors[text]
+        return embed
+
+    @pytest.mark.asyncio
+    async def test_paraphrase_hit(self):
+        """A close enough vector returns the stored answer."""
+        cache = SemanticCache(
+            self._embedder({"원문": [1.0, 0.0], "유사": [0.99, 0.05], "무관": [0.0, 1.0]}),
+            threshold=0.9
+        )
+
+        cached, vector = await cache.lookup("원문")
+        assert cached is None
+        cache.add(vector, _entry("A"))
+
+        hit, _ = await cache.lookup("유사")
+        assert hit.payload == {"answer": "A"}
+
+        miss, _ = await cache.lookup("무관")
+        assert miss is None
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_are_dropped(self):
+        """Expired entries never match and are removed during lookup."""
+        cache = SemanticCache(self._embedder({"q": [1.0, 0.0]}), ttl=0.01)
+        _, vector = await cache.lookup("q")
+        cache.add(vector, _entry("A"))
+        time.sleep(0.02)
+
+        hit, _ = await cache.lookup("q")
+        assert hit is None
+        assert len(cache) == 0
+
+
+class TestEmbeddingBatcher:
+    """Test suite for EmbeddingBatcher."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_one_call(self):
+        """Requests within the window are embedded in one batch, in order."""
+        calls = []
+
+        async def embed_batch(texts):
+            calls.append(list(texts))
+            return [[float(len(text))] for text in texts]
+
+        batcher = EmbeddingBatcher(embed_batch, flush_interval=0.01)
+        vectors = await asyncio.gather(*(batcher.submit(text) for text in ["a", "bb", "ccc"]))
+
+        assert calls == [["a", "bb", "ccc"]]
+        assert vectors == [[1.0], [2.0], [3.0]]
+
+    @pytest.mark.asyncio
+    async def test_full_batch_flushes_and_errors_propagate(self):
+        """A full batch is sent immediately and a failure reaches every caller."""
+        async def embed_batch(texts):
+            raise RuntimeError("boom")
+
+        batcher = EmbeddingBatcher(embed_batch, flush_interval=60.0, max_batch=2)
+        results = await asyncio.wait_for(
+            asyncio.gather(batcher.submit("a"), batcher.submit("b"), return_exceptions=True),
+            timeout=1.0
+        )
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+
+    @pytest.mark.asyncio
+    async def test_short_batch_result_fails_every_caller(self):
+        """Missing embeddings fail the whole batch instead of leaving callers waiting."""
+        async def embed_batch(texts):
+            return [[1.0]]
+
+        batcher = EmbeddingBatcher(embed_batch, flush_interval=0.01)
+        results = await asyncio.wait_for(
+            asyncio.gather(batcher.submit("a"), batcher.submit("b"), return_exceptions=True),
+            timeout=1.0
+        )
+
+        assert all(isinstance(result, ValueError) for result in results)